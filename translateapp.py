@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 
@@ -7,10 +8,19 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPixmapCache
 from translateapp.ui.main_window import MainWindow
 
 def main():
+    # Configure logging once at the entry point rather than as a module
+    # import side effect
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     app = QApplication(sys.argv)
+    # 64 MB pixmap cache (in KB) so covers survive window re-opens
+    QPixmapCache.setCacheLimit(64 * 1024)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,23 @@
+import atexit
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# Process-wide HTTP session shared by the UI's cover loaders. Keep-alive
+# reuses one pooled connection per host (covers all come from the same
+# CDN), and the retry policy absorbs transient failures with a short
+# backoff instead of surfacing them as missing images.
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'MangaTranslatorApp/1.0'
+
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# (connect, read) timeouts so a stalled server can't pin a worker
+DEFAULT_TIMEOUT = (3.05, 10)
+
+atexit.register(SESSION.close)
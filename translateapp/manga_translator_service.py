@@ -102,6 +102,11 @@ class MangaTranslatorService(QObject):
         # Queue locks
         self._download_lock = threading.Lock()
         self._translation_lock = threading.Lock()
+
+        # Mirror of the chapter numbers sitting in either queue so
+        # is_queued is an O(1) set lookup instead of a queue walk
+        self._queued_numbers = set()
+        self._queued_lock = threading.Lock()
         
         # Queue status
         self.queue_status = QueueStatus(
@@ -138,9 +143,14 @@ class MangaTranslatorService(QObject):
         chapter_dir = os.path.join(self.base_dir, manga_id, f"chapter_{chapter.number}")
         
         # Check if either zip exists or chapter directory exists and is not empty
-        return (os.path.exists(chapter_zip) or 
+        return (os.path.exists(chapter_zip) or
                 (os.path.exists(chapter_dir) and len(os.listdir(chapter_dir)) > 0))
-    
+
+    def is_queued(self, chapter_number: float) -> bool:
+        """Check whether a chapter number is waiting in either queue"""
+        with self._queued_lock:
+            return chapter_number in self._queued_numbers
+
     def is_translated(self, chapter: Chapter, manga_url: str) -> bool:
         """Check if chapter is already translated"""
         manga_id = self.get_manga_id(manga_url)
@@ -159,7 +169,73 @@ class MangaTranslatorService(QObject):
         
         # Consider translated if translated directory has same number of image files
         return len(translated_files) > 0 and len(translated_files) == len(chapter_files)
-    
+
+    def scan_status(self, manga_url: str) -> dict:
+        """Batch downloaded/translated checks for a whole manga.
+
+        One os.scandir over the manga directory replaces the per-chapter
+        filesystem probes is_downloaded/is_translated would issue in a
+        loop; only chapters actually present locally cost extra listdir
+        calls. Returns {chapter number: (downloaded, translated)} using
+        the same criteria as the per-chapter checks.
+        """
+        manga_id = self.get_manga_id(manga_url)
+        manga_dir = os.path.join(self.base_dir, manga_id)
+
+        zips = set()
+        chapter_dirs = {}
+        translated_dirs = {}
+        try:
+            with os.scandir(manga_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith('chapter_'):
+                        continue
+                    if entry.is_file() and name.endswith('.zip'):
+                        zips.add(name[len('chapter_'):-len('.zip')])
+                    elif entry.is_dir():
+                        if name.endswith('_translated'):
+                            key = name[len('chapter_'):-len('_translated')]
+                            translated_dirs[key] = entry.path
+                        else:
+                            chapter_dirs[name[len('chapter_'):]] = entry.path
+        except OSError:
+            return {}
+
+        def count_images(path):
+            try:
+                return len([f for f in os.listdir(path)
+                            if f.lower().endswith(('.jpg', '.png', '.jpeg'))])
+            except OSError:
+                return 0
+
+        status = {}
+        for key in zips | set(chapter_dirs) | set(translated_dirs):
+            try:
+                number = float(key)
+            except ValueError:
+                continue
+
+            downloaded = key in zips
+            image_count = 0
+            if key in chapter_dirs:
+                try:
+                    entries = os.listdir(chapter_dirs[key])
+                except OSError:
+                    entries = []
+                downloaded = downloaded or len(entries) > 0
+                image_count = len([f for f in entries
+                                   if f.lower().endswith(('.jpg', '.png', '.jpeg'))])
+
+            translated = False
+            if key in translated_dirs and key in chapter_dirs:
+                translated_count = count_images(translated_dirs[key])
+                translated = (translated_count > 0 and
+                              translated_count == image_count)
+
+            status[number] = (downloaded, translated)
+        return status
+
     def start_download(self, chapter: Chapter, manga_url: str):
         """
         Start downloading chapter directly without queueing
@@ -215,14 +291,19 @@ class MangaTranslatorService(QObject):
                     total_size = int(response.headers.get('content-length', 0))
                     block_size = 8192
                     downloaded = 0
-                    
+                    last_percent = -1
+
                     with open(file_path, 'wb') as f:
                         for data in response.iter_content(block_size):
                             downloaded += len(data)
                             f.write(data)
                             if total_size > 0:
                                 progress = (downloaded / total_size) * 100
-                                self.download_progress.emit(progress)
+                                # Coalesce: one emission per whole percent
+                                # instead of one per 8 KB block
+                                if int(progress) != last_percent:
+                                    last_percent = int(progress)
+                                    self.download_progress.emit(progress)
                     
                     # Verify zip file
                     try:
@@ -285,6 +366,8 @@ class MangaTranslatorService(QObject):
                     self._add_to_translation_queue(chapter, manga)
                 else:
                     # Add to download queue
+                    with self._queued_lock:
+                        self._queued_numbers.add(chapter.number)
                     self.download_queue.put(download_task)
                     if not self.is_downloading:
                         self.is_downloading = True
@@ -302,6 +385,8 @@ class MangaTranslatorService(QObject):
             try:
                 # Get next download task
                 task = self.download_queue.get(block=False)
+                with self._queued_lock:
+                    self._queued_numbers.discard(task.chapter.number)
                 self.current_download = task
                 
                 # Update status
@@ -341,6 +426,8 @@ class MangaTranslatorService(QObject):
         translation_task = TranslationTask(chapter=chapter, manga=manga)
         
         with self._translation_lock:
+            with self._queued_lock:
+                self._queued_numbers.add(chapter.number)
             self.translation_queue.put(translation_task)
             if not self.is_translating:
                 self.is_translating = True
@@ -354,6 +441,8 @@ class MangaTranslatorService(QObject):
             try:
                 # Get next translation task
                 task = self.translation_queue.get(block=False)
+                with self._queued_lock:
+                    self._queued_numbers.discard(task.chapter.number)
                 self.current_translation = task
                 
                 # Update status
@@ -534,7 +623,10 @@ class MangaTranslatorService(QObject):
             while not self.translation_queue.empty():
                 self.translation_queue.get()
                 self.translation_queue.task_done()
-        
+
+        with self._queued_lock:
+            self._queued_numbers.clear()
+
         # Reset status
         self.queue_status = QueueStatus(queued_chapters=[])
         self._emit_queue_status()
@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
-@dataclass
+# slots=True: the parser builds thousands of these per browsing
+# session, and slotted instances skip the per-object __dict__
+
+@dataclass(slots=True)
 class Chapter:
     title: str
     url: str
@@ -12,8 +15,21 @@ class Chapter:
     manga_title: str = ""
     manga_id: str = ""
     manga_cover: str = ""
+    _date_str: Optional[str] = field(
+        default=None, repr=False, compare=False)
+
+    @property
+    def date_str(self) -> str:
+        """Date as 'YYYY-MM-DD', formatted once per chapter.
+
+        isoformat() is a C fast path, unlike strftime which re-parses
+        its format string on every call in the row-building loop.
+        """
+        if self._date_str is None:
+            self._date_str = self.date.isoformat()[:10] if self.date else ""
+        return self._date_str
 
-@dataclass
+@dataclass(slots=True)
 class Manga:
     title: str
     cover_image: str
@@ -21,4 +37,4 @@ class Manga:
     url: str
     chapters: List[Chapter]
     genres: List[str] = None
-    description: Optional[str] = None 
\ No newline at end of file
+    description: Optional[str] = None
\ No newline at end of file
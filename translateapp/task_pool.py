@@ -0,0 +1,58 @@
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+class TaskPool:
+    """
+    Bounded worker pool for background network/IO tasks.
+
+    Keeps concurrency at a browser-like per-host limit (6 by default) and
+    rate-limits task starts so prefetching many covers at once cannot
+    hammer the origin or saturate the connection.
+    """
+    # Singleton instance
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_concurrent: int = 6, rate_per_sec: float = 10):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent,
+            thread_name_prefix="task-pool"
+        )
+        self._min_interval = 1.0 / rate_per_sec if rate_per_sec else 0.0
+        self._last_start = 0.0
+        self._rate_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get the shared pool used for cover/detail fetches"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) on the pool, returns a Future"""
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn, *args, **kwargs):
+        self._throttle()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in pooled task {fn!r}: {e}")
+            raise
+
+    def _throttle(self):
+        """Delay task start so we never exceed the configured rate"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._last_start + self._min_interval - now
+            if wait > 0:
+                time.sleep(wait)
+                now = time.monotonic()
+            self._last_start = now
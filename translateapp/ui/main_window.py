@@ -2,25 +2,27 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QLineEdit, QPushButton, QScrollArea, QGridLayout,
                             QLabel, QMenuBar, QMenu, QMessageBox, QFrame, 
                             QDialog, QStackedWidget)
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QUrl, QSize
-from PyQt6.QtGui import QPixmap, QPalette, QColor, QDesktopServices, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QUrl, QSize, QRect
+from PyQt6.QtGui import (QPixmap, QImage, QPalette, QColor, QDesktopServices,
+                         QIcon)
 import logging
-import threading
-from PIL import Image
-from PIL.ImageQt import ImageQt
-import requests
-from io import BytesIO
 import os
 
 from ..web_parser import RawKumaParser
 from ..manga_translator_service import MangaTranslatorService
+from ..task_pool import TaskPool
+from ..http_client import SESSION, DEFAULT_TIMEOUT
+from .. import cover_cache
 from ..config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
 class MangaCard(QFrame):
     clicked = pyqtSignal(object)
-    image_loaded = pyqtSignal(QPixmap)
+    # Carries a QImage: the cover is decoded and scaled on a pool
+    # worker, where QImage is safe and QPixmap is not; the slot
+    # converts on the GUI thread
+    image_loaded = pyqtSignal(QImage)
     error_occurred = pyqtSignal()
     
     def __init__(self, manga, parent=None):
@@ -111,9 +113,17 @@ class MangaCard(QFrame):
         # Connect destroyed signal
         self.destroyed.connect(self._on_destroyed)
         
-        # Load image in background
-        threading.Thread(target=self._load_cover_image, daemon=True).start()
-    
+        # Cover loading is deferred until the card scrolls into view;
+        # the parent grid calls ensure_cover_loaded
+        self._load_started = False
+
+    def ensure_cover_loaded(self):
+        """Start the cover fetch once, when the card becomes visible"""
+        if self._load_started or self._destroyed:
+            return
+        self._load_started = True
+        TaskPool.get_instance().submit(self._load_cover_image)
+
     def _on_destroyed(self):
         self._destroyed = True
     
@@ -126,49 +136,59 @@ class MangaCard(QFrame):
                 # Local file
                 file_path = self.manga.cover_image[8:]  # Remove 'file:///'
                 if os.path.exists(file_path):
-                    pixmap = QPixmap(file_path)
+                    image = QImage(file_path)
                 else:
                     self.error_occurred.emit()
                     return
             else:
-                # Remote file
-                response = requests.get(self.manga.cover_image)
-                img_data = response.content
-                
+                # Serve the shared pre-scaled thumbnail from disk; only
+                # a cold URL pays for the download and decode
+                img_data = cover_cache.get(self.manga.cover_image)
+                if img_data is None:
+                    # Stream the body straight into the decoder instead
+                    # of buffering the whole JPEG first
+                    with SESSION.get(self.manga.cover_image, stream=True,
+                                     timeout=DEFAULT_TIMEOUT) as response:
+                        response.raise_for_status()
+                        response.raw.decode_content = True
+                        img_data = cover_cache.make_thumbnail(response.raw)
+                    cover_cache.put(self.manga.cover_image, img_data)
+
                 if self._destroyed:
                     return
-                
-                pixmap = QPixmap()
-                pixmap.loadFromData(img_data)
-            
+
+                image = QImage()
+                image.loadFromData(img_data)
+
             if self._destroyed:
                 return
-            
-            # Scale pixmap to fit the label while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
+
+            # Scale to fill the label while maintaining aspect ratio;
+            # QImage keeps this safe on the worker thread
+            scaled = image.scaled(
                 150, 200,
                 Qt.AspectRatioMode.KeepAspectRatioByExpanding,
                 Qt.TransformationMode.SmoothTransformation
             )
-            
+
             # Center crop if needed
-            if scaled_pixmap.width() > 150 or scaled_pixmap.height() > 200:
-                x = (scaled_pixmap.width() - 150) // 2 if scaled_pixmap.width() > 150 else 0
-                y = (scaled_pixmap.height() - 200) // 2 if scaled_pixmap.height() > 200 else 0
-                scaled_pixmap = scaled_pixmap.copy(x, y, 150, 200)
-            
+            if scaled.width() > 150 or scaled.height() > 200:
+                x = (scaled.width() - 150) // 2 if scaled.width() > 150 else 0
+                y = (scaled.height() - 200) // 2 if scaled.height() > 200 else 0
+                scaled = scaled.copy(x, y, 150, 200)
+
             if not self._destroyed:
-                self.image_loaded.emit(scaled_pixmap)
+                self.image_loaded.emit(scaled)
             
         except Exception as e:
             logger.error(f"Error loading image for {self.manga.title}: {e}")
             if not self._destroyed:
                 self.error_occurred.emit()
     
-    def _on_image_loaded(self, pixmap):
-        """Update image in the main thread"""
+    def _on_image_loaded(self, image):
+        """Build the pixmap and update the label in the main thread"""
         if not self._destroyed:
-            self.image_label.setPixmap(pixmap)
+            self.image_label.setPixmap(QPixmap.fromImage(image))
     
     def _on_error(self):
         """Handle error in the main thread"""
@@ -253,7 +273,15 @@ class MainWindow(QMainWindow):
         self.resize_timer.setSingleShot(True)
         self.resize_timer.setInterval(150)
         self.resize_timer.timeout.connect(self._handle_resize)
-        
+
+        # Debounced scroll-driven cover loading: cards only fetch their
+        # cover once they come near the viewport
+        self._manga_cards = []
+        self._cover_timer = QTimer()
+        self._cover_timer.setSingleShot(True)
+        self._cover_timer.setInterval(100)
+        self._cover_timer.timeout.connect(self._load_visible_covers)
+
         # Create manga loader
         self.manga_loader = MangaLoader()
         self.manga_loader.finished.connect(self._on_manga_loaded)
@@ -384,6 +412,7 @@ class MainWindow(QMainWindow):
         self.grid_widget = QWidget()
         self.grid_layout = QGridLayout(self.grid_widget)
         self.scroll_area.setWidget(self.grid_widget)
+        self._watch_grid_scroll()
         grid_layout.addWidget(self.scroll_area)
         
         # Navigation buttons
@@ -446,12 +475,8 @@ class MainWindow(QMainWindow):
         if page > self.current_page and self.next_url:
             url = self.next_url
         
-        # Start loading in background thread
-        threading.Thread(
-            target=self.manga_loader.load_page,
-            args=(page, url),
-            daemon=True
-        ).start()
+        # Start loading on the shared pool
+        TaskPool.get_instance().submit(self.manga_loader.load_page, page, url)
     
     def _on_manga_loaded(self, manga_list, next_url):
         # Close loading dialog
@@ -536,7 +561,9 @@ class MainWindow(QMainWindow):
         # Store current list for resize events
         self.current_manga_list = manga_list
         
-        # Clear existing grid
+        # Clear existing grid (drop card references first so the scroll
+        # handler can't touch widgets scheduled for deletion)
+        self._manga_cards = []
         self.clear_grid()
         
         # Calculate layout
@@ -555,10 +582,34 @@ class MainWindow(QMainWindow):
             card = MangaCard(manga)
             card.clicked.connect(self.show_manga_detail)
             self.grid_layout.addWidget(card, row, col, Qt.AlignmentFlag.AlignCenter)
-        
+            self._manga_cards.append(card)
+
         # Add stretch to bottom row
         bottom_row = (len(manga_list) + columns - 1) // columns
         self.grid_layout.setRowStretch(bottom_row, 1)
+
+        # Kick off covers for the initially visible cards once layout settles
+        QTimer.singleShot(0, self._load_visible_covers)
+
+    def _watch_grid_scroll(self):
+        # Debounce scroll events so a fast flick doesn't queue a fetch
+        # for every row it skips past
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            lambda _: self._cover_timer.start())
+
+    def _load_visible_covers(self):
+        """Start cover fetches only for cards in or near the viewport"""
+        if not self._manga_cards:
+            return
+        viewport = self.scroll_area.viewport()
+        # Prefetch one viewport height ahead and a little behind
+        visible = viewport.rect().adjusted(0, -100, 0, viewport.height())
+        for card in self._manga_cards:
+            if card._load_started:
+                continue
+            origin = card.mapTo(viewport, card.rect().topLeft())
+            if visible.intersects(QRect(origin, card.size())):
+                card.ensure_cover_loaded()
     
     def show_manga_detail(self, manga):
         from .manga_detail import MangaDetailWindow
@@ -638,6 +689,7 @@ class MainWindow(QMainWindow):
         self.grid_widget = QWidget()
         self.grid_layout = QGridLayout(self.grid_widget)
         self.scroll_area.setWidget(self.grid_widget)
+        self._watch_grid_scroll()
         main_layout.addWidget(self.scroll_area)
         
         # Restore navigation buttons
@@ -754,6 +806,7 @@ class MainWindow(QMainWindow):
         self.grid_widget = QWidget()
         self.grid_layout = QGridLayout(self.grid_widget)
         self.scroll_area.setWidget(self.grid_widget)
+        self._watch_grid_scroll()
         main_layout.addWidget(self.scroll_area)
         
         # Clear current manga list and display local mangas
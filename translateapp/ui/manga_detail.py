@@ -1,13 +1,23 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QPushButton, QLabel, QScrollArea, QFrame, QListWidget,
                             QListWidgetItem, QMenuBar, QProgressBar, QMessageBox)
-from PyQt6.QtCore import Qt, QObject, pyqtSignal
-from PyQt6.QtGui import QPixmap, QIcon
-import requests
+from PyQt6.QtCore import (Qt, QObject, QTimer, pyqtSignal, pyqtSlot,
+                          QMetaObject, QByteArray, Q_ARG)
+from PyQt6.QtGui import QPixmap, QPixmapCache, QIcon
 from io import BytesIO
+from collections import OrderedDict
+import functools
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+import hashlib
 import logging
 import threading
+import time
 from ..web_parser import RawKumaParser
+from ..task_pool import TaskPool
+from .. import cover_cache
+from .. import http_client
 from ..manga_translator_service import (
     MangaTranslatorService, QueueStatus, 
     TranslationTask, DownloadTask
@@ -16,24 +26,392 @@ from ..models import Manga, Chapter
 import os
 import json
 import re
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 
-class MangaDetailsLoader(QObject):
-    finished = pyqtSignal(dict)  # Signal for manga details
-    error = pyqtSignal(str)
+# Parsed manga details are also cached on disk so a restart (or an
+# evicted in-memory entry) can skip the HTTP GET + HTML parse
+DETAILS_CACHE_DIR = Path.home() / ".cache" / "manga_translator" / "details"
+DETAILS_CACHE_TTL = 3600  # seconds
+
+# Covers change rarely; re-fetch after a week to pick up replacements
+COVER_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Upper bound on a cover download; anything larger is not a cover
+COVER_MAX_BYTES = 8 * 1024 * 1024
+
+# Compiled once; the escaped dot keeps names like chapter_1_zip from
+# slipping through
+_CHAPTER_ZIP_RE = re.compile(r'chapter_(\d+(?:\.\d+)?)\.zip')
+
+# Pre-built star strings indexed by filled-star count (0-5)
+_STAR_CACHE = ["☆☆☆☆☆", "★☆☆☆☆", "★★☆☆☆", "★★★☆☆", "★★★★☆", "★★★★★"]
+
+
+def _format_rating(rating):
+    """Render a 0-10 rating as a five-star string, e.g. '★★★☆☆ (6.5/10)'"""
+    filled = max(0, min(5, int(rating * 5 / 10)))
+    return f"{_STAR_CACHE[filled]} ({rating}/10)"
+
+@functools.lru_cache(maxsize=128)
+def _load_manga_info(info_path: str, mtime_ns: int) -> dict:
+    """Parse a manga-info.txt file.
+
+    Keyed by (path, mtime) so repeat opens of the same local manga skip
+    the file read and JSON parse while edits still invalidate.
+    """
+    with open(info_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Cover downloads go through the process-wide pooled session; the
+# in-flight map makes windows racing for the same cover share a single
+# transfer
+_cover_inflight = {}  # cover url -> threading.Event
+_cover_inflight_lock = threading.Lock()
+
+# Single stylesheet for the whole detail window; widgets are matched by
+# object name so Qt parses and polishes the sheet only once per window.
+MANGA_DETAIL_QSS = """
+    QWidget {
+        background-color: #121212;
+        color: #E0E0E0;
+    }
+    
+    QFrame {
+        background-color: #1E1E1E;
+        border: 1px solid #333333;
+    }
+    
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    
+    QPushButton:hover {
+        background-color: #1E88E5;
+    }
+    
+    QListWidget {
+        background-color: #1E1E1E;
+        border: none;
+    }
+    
+    QListWidget::item {
+        background-color: #1E1E1E;
+        border-bottom: 1px solid #333333;
+    }
+    
+    QListWidget::item:hover {
+        background-color: #2D2D2D;
+    }
+    
+    QScrollArea {
+        border: none;
+    }
+    
+    QScrollArea#detailScroll {
+        border: none;
+        background-color: #121212;
+    }
+    
+    QScrollBar:vertical {
+        background-color: #1E1E1E;
+        width: 12px;
+        margin: 0;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #424242;
+        min-height: 20px;
+        border-radius: 6px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #4F4F4F;
+    }
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+    }
+    
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background-color: #1E1E1E;
+    }
+    
+    QFrame#detailHeader {
+        background-color: #1E1E1E;
+        border-bottom: 1px solid #333333;
+    }
+    
+    QLabel#headerTitle {
+        font-size: 18pt;
+        font-weight: bold;
+        color: #FFFFFF;
+        border: 0px;
+    }
+    
+    QFrame#detailContent {
+        background-color: #121212;
+        margin: 16px;
+    }
+    
+    QLabel#coverLabel {
+        background-color: #2D2D2D;
+    }
     
-    def load_details(self, manga: Manga):
+    QLabel#mangaTitle {
+        font-size: 24pt;
+        font-weight: bold;
+        color: #FFFFFF;
+        border: 0px;
+    }
+    
+    QWidget#ratingWidget {
+        background-color: transparent;
+        border: 0px;
+    }
+    
+    QLabel#ratingLabel {
+        font-size: 16pt;
+        color: #FFC107;
+        border: 0px;
+    }
+    
+    QLabel#chapterCount {
+        font-size: 14pt;
+        color: #B0B0B0;
+        border: 0px;
+    }
+    
+    QLabel#descriptionLabel {
+        color: #9E9E9E;
+        font-size: 12pt;
+        border: 0px;
+    }
+    
+    QFrame#chapterContainer {
+        background-color: #1E1E1E;
+        margin: 0 16px 16px 16px;
+        border-radius: 8px;
+        border: 1px solid #333333;
+    }
+    
+    QLabel#chapterListHeader {
+        font-size: 16pt;
+        font-weight: bold;
+        color: #FFFFFF;
+        padding-top: 16px;
+        padding-bottom: 16px;
+        border: 0px;
+        background-color: transparent;
+    }
+    
+    QFrame#chapterSeparator {
+        background-color: #B5B5B5;
+        border: 1px solid #B5B5B5;
+    }
+    
+    ChapterListItem {
+        background-color: #2D2D2D;
+        border-radius: 6px;
+        margin: 2px 8px;
+    }
+
+    ChapterListItem:hover {
+        background-color: #363636;
+    }
+    
+    QLabel#chapterTitle {
+        font-weight: bold;
+        color: #FFFFFF;
+        font-size: 13px;
+        border: 0px;
+    }
+    
+    QLabel#chapterDate {
+        color: #B0B0B0;
+        font-size: 11px;
+        border: 0px;
+    }
+    
+    QPushButton#translateBtn {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 4px 8px;
+        border-radius: 3px;
+        font-size: 11px;
+    }
+    
+    QPushButton#translateBtn:hover {
+        background-color: #1E88E5;
+    }
+    
+    QPushButton#translateBtn:disabled {
+        background-color: #424242;
+        color: #808080;
+    }
+
+    /* Queue/translation state is tracked via the trState dynamic
+       property; flipping it only needs a repolish, not a stylesheet
+       re-parse per button */
+    QPushButton#translateBtn[trState="waiting-download"],
+    QPushButton#translateBtn[trState="waiting-download"]:disabled {
+        background-color: #FFA726;
+        color: white;
+    }
+
+    QPushButton#translateBtn[trState="waiting-translation"],
+    QPushButton#translateBtn[trState="waiting-translation"]:disabled {
+        background-color: #7E57C2;
+        color: white;
+    }
+
+    QPushButton#translateBtn[trState="done"],
+    QPushButton#translateBtn[trState="done"]:disabled {
+        background-color: #4CAF50;
+        color: white;
+    }
+"""
+
+class MangaDetailsLoader(QObject):
+    """
+    Shared manga-details loader.
+
+    One instance serves every detail window: parses run on the shared
+    TaskPool, recent results are cached per manga URL, and duplicate
+    requests for a URL already being fetched are coalesced. Windows
+    filter the (url, ...) signals on their own manga URL.
+    """
+    # Signals carry only the manga url; the details dict stays on the
+    # loader and receivers read it back via result(), keeping the
+    # cross-thread queued delivery payload-free
+    finished = pyqtSignal(str)    # manga url
+    error = pyqtSignal(str, str)  # (manga url, error message)
+
+    # Singleton instance
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    CACHE_SIZE = 256
+
+    def __init__(self):
+        super().__init__()
+        self._cache = OrderedDict()  # manga url -> details dict (LRU)
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """Get the singleton instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def fetch(self, manga: Manga):
+        """Load details for manga, serving from cache when possible"""
+        url = manga.url
+        with self._lock:
+            details = self._cache.get(url)
+            if details is not None:
+                self._cache.move_to_end(url)
+            elif url in self._in_flight:
+                return  # already being fetched, signal will fan out
+            else:
+                self._in_flight.add(url)
+
+        if details is not None:
+            self.finished.emit(url)
+            return
+
+        TaskPool.get_instance().submit(self._load_details, manga)
+
+    def result(self, url: str):
+        """Return the cached details for url, or None"""
+        with self._lock:
+            return self._cache.get(url)
+
+    def _load_details(self, manga: Manga):
         try:
-            parser = RawKumaParser()
-            details = parser.parse_manga_details(manga)
-            self.finished.emit(details)
+            details = self._load_from_disk(manga.url)
+            if details is None:
+                # Parser methods are all static; no instance needed
+                details = RawKumaParser.parse_manga_details(manga)
+                self._save_to_disk(manga.url, details)
+            # Sort once at ingestion, on the worker, so UI refreshes
+            # just iterate the list (newest chapter first)
+            details.get('chapters', []).sort(
+                key=attrgetter('number'), reverse=True)
+            with self._lock:
+                self._cache[manga.url] = details
+                while len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            self.finished.emit(manga.url)
         except Exception as e:
             logger.error(f"Error loading manga details: {e}")
-            self.error.emit(str(e))
+            self.error.emit(manga.url, str(e))
+        finally:
+            with self._lock:
+                self._in_flight.discard(manga.url)
+
+    @staticmethod
+    def _disk_path(url: str) -> Path:
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return DETAILS_CACHE_DIR / f"{digest}.json"
+
+    def _load_from_disk(self, url: str):
+        """Return cached details if fresher than the TTL, else None"""
+        try:
+            path = self._disk_path(url)
+            if not path.exists():
+                return None
+            if time.time() - path.stat().st_mtime > DETAILS_CACHE_TTL:
+                return None
+            data = json.loads(path.read_text(encoding='utf-8'))
+            chapters = []
+            for item in data.get('chapters', []):
+                date = item.get('date')
+                item['date'] = datetime.fromisoformat(date) if date else None
+                chapters.append(Chapter(**item))
+            return {
+                'chapters': chapters,
+                'description': data.get('description', ''),
+                'genres': data.get('genres', [])
+            }
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Error reading details cache: {e}")
+            return None
+
+    def _save_to_disk(self, url: str, details: dict):
+        """Persist details as JSON; cache errors are non-fatal"""
+        try:
+            DETAILS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            payload = {
+                'description': details.get('description', ''),
+                'genres': details.get('genres', []),
+                'chapters': [
+                    {**asdict(ch),
+                     'date': ch.date.isoformat() if ch.date else None}
+                    for ch in details.get('chapters', [])
+                ]
+            }
+            path = self._disk_path(url)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text(
+                json.dumps(payload, ensure_ascii=False), encoding='utf-8'
+            )
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Error writing details cache: {e}")
 
 class ChapterListItem(QWidget):
-    def __init__(self, chapter, manga, main_window, parent=None):
+    def __init__(self, chapter, manga, main_window, translator=None, parent=None):
         super().__init__(parent)
         self.chapter = chapter
         self.manga = manga
@@ -43,88 +421,40 @@ class ChapterListItem(QWidget):
         # Set fixed height
         self.setFixedHeight(50)
         
-        # Get translator service instance
-        self.translator = MangaTranslatorService.get_instance()
+        # Translator service shared with the owning window; queue status
+        # updates are dispatched by MangaDetailWindow, not connected here
+        self.translator = translator or MangaTranslatorService.get_instance()
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 0, 16, 0)  # Remove vertical margins
         layout.setSpacing(8)
         
-        # Left side info
-        info_container = QHBoxLayout()
-        info_container.setSpacing(8)
-        
-        # Chapter number
+        # Left side info, laid out flat to keep per-row object count low
         title = QLabel(f"Chapter {chapter.number}")
-        title.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                color: #FFFFFF;  /* White text */
-                font-size: 13px;
-                border: 0px;
-            }
-        """)
-        info_container.addWidget(title)
+        title.setObjectName("chapterTitle")
+        layout.addWidget(title)
         
         # Date if available
         if chapter.date:
-            date = QLabel(chapter.date.strftime('%Y-%m-%d'))
-            date.setStyleSheet("""
-                QLabel {
-                    color: #B0B0B0;  /* Light grey text */
-                    font-size: 11px;
-                    border: 0px;
-                }
-            """)
-            info_container.addWidget(date)
-        
-        # Create widget for info container
-        info_widget = QWidget()
-        info_widget.setLayout(info_container)
-        info_widget.setStyleSheet("background: transparent;")  # Make container transparent
-        layout.addWidget(info_widget)
+            date = QLabel(chapter.date_str)
+            date.setObjectName("chapterDate")
+            layout.addWidget(date)
         
         # Add stretch to push button to right
         layout.addStretch()
         
-        # Translate button
+        # Translate button (default style comes from the shared sheet)
         self.translate_btn = QPushButton("Translate")
+        self.translate_btn.setObjectName("translateBtn")
         self.translate_btn.setFixedWidth(100)
-        self.translate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-            QPushButton:disabled {
-                background-color: #424242;
-                color: #808080;
-            }
-        """)
         self.translate_btn.clicked.connect(self.start_translation)
         layout.addWidget(self.translate_btn)
         
-        # Set card-like style for the whole widget
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2D2D2D;  /* Darker grey background */
-                border-radius: 6px;         /* Rounded corners */
-                margin: 2px 8px;            /* Add some margin */
-            }
-            QWidget:hover {
-                background-color: #363636;  /* Slightly lighter on hover */
-            }
-        """)
-        
-        # Connect to queue status signal
-        self.translator.queue_status_changed.connect(self.on_queue_status_changed)
-        
+        # Card-like style comes from the ChapterListItem rule in the
+        # shared sheet; plain QWidget subclasses need this attribute for
+        # stylesheet backgrounds to actually paint
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+
         # Check initial queue status
         self.update_button_state()
         
@@ -143,17 +473,15 @@ class ChapterListItem(QWidget):
     def update_button_state(self):
         """Update translate button state based on queue status"""
         queue_size, current_task = self.translator.get_queue_status()
-        
+
         # Check if this chapter is in queue or currently processing
-        is_in_queue = False
-        if current_task and current_task.chapter.number == self.chapter.number:
-            is_in_queue = True
-        else:
-            for task in self.translator.translation_queue.queue:
-                if task.chapter.number == self.chapter.number:
-                    is_in_queue = True
-                    break
-        
+        # (O(1) set lookup on the service instead of walking the queue)
+        is_in_queue = (
+            (current_task is not None and
+             current_task.chapter.number == self.chapter.number) or
+            self.translator.is_queued(self.chapter.number)
+        )
+
         # Update button state
         self.translate_btn.setEnabled(not is_in_queue)
         if is_in_queue:
@@ -161,107 +489,58 @@ class ChapterListItem(QWidget):
         else:
             self.translate_btn.setText("Translate")
     
-    def on_queue_status_changed(self, status: QueueStatus):
-        """Handle queue status changes"""
+    def apply_status(self, current_download, current_translation,
+                     download_queued, translation_queued, translated):
+        """Apply a queue status update pre-digested by the parent window.
+
+        The window computes the current-task numbers and queued-number
+        sets once per update, so each row only does set lookups instead
+        of walking the queue itself.
+        """
+        number = self.chapter.number
+
         # Check if this chapter is current task
-        if status.current_task:
-            if isinstance(status.current_task, DownloadTask):
-                if status.current_task.chapter.number == self.chapter.number:
-                    self.translate_btn.setEnabled(False)
-                    self.translate_btn.setText("Downloading...")
-                    return
-            elif isinstance(status.current_task, TranslationTask):
-                if status.current_task.chapter.number == self.chapter.number:
-                    self.translate_btn.setEnabled(False)
-                    self.translate_btn.setText("Translating...")
-                    return
-        
+        if number == current_download:
+            self.translate_btn.setEnabled(False)
+            self.translate_btn.setText("Downloading...")
+            return
+        if number == current_translation:
+            self.translate_btn.setEnabled(False)
+            self.translate_btn.setText("Translating...")
+            return
+
         # Check if this chapter is in queue
-        is_in_download_queue = False
-        is_in_translation_queue = False
-        
-        for task in status.queued_chapters:
-            if task.chapter.number == self.chapter.number:
-                if isinstance(task, DownloadTask):
-                    is_in_download_queue = True
-                    break
-                elif isinstance(task, TranslationTask):
-                    is_in_translation_queue = True
-                    break
-        
+        is_in_download_queue = number in download_queued
+        is_in_translation_queue = number in translation_queued
+
         # Update button state based on queue status
         self.translate_btn.setEnabled(not (is_in_download_queue or is_in_translation_queue))
         if is_in_download_queue:
             self.translate_btn.setText("Waiting for Download")
-            self.translate_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFA726;
-                    color: white;
-                    border: none;
-                    padding: 4px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                }
-                QPushButton:disabled {
-                    background-color: #FFA726;
-                    color: white;
-                    opacity: 0.7;
-                }
-            """)
+            self._set_button_state('waiting-download')
         elif is_in_translation_queue:
             self.translate_btn.setText("Waiting for Translation")
-            self.translate_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #7E57C2;
-                    color: white;
-                    border: none;
-                    padding: 4px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                }
-                QPushButton:disabled {
-                    background-color: #7E57C2;
-                    color: white;
-                    opacity: 0.7;
-                }
-            """)
-        elif self.translator.is_translated(self.chapter, self.manga.url):
+            self._set_button_state('waiting-translation')
+        elif number in translated:
             self.translate_btn.setText("Translated")
-            self.translate_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: none;
-                    padding: 4px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                }
-                QPushButton:disabled {
-                    background-color: #4CAF50;
-                    color: white;
-                    opacity: 0.7;
-                }
-            """)
+            self._set_button_state('done')
         else:
             self.translate_btn.setText("Translate")
-            self.translate_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    padding: 4px 8px;
-                    border-radius: 3px;
-                    font-size: 11px;
-                }
-                QPushButton:hover {
-                    background-color: #1E88E5;
-                }
-                QPushButton:disabled {
-                    background-color: #424242;
-                    color: #808080;
-                }
-            """)
-    
+            self._set_button_state('')
+
+    def _set_button_state(self, state: str):
+        """Flip the button's trState property and repolish if it changed.
+
+        The colors live in the shared sheet keyed on this property, so a
+        state change costs one repolish instead of a stylesheet parse.
+        """
+        if self.translate_btn.property('trState') == state:
+            return
+        self.translate_btn.setProperty('trState', state)
+        style = self.translate_btn.style()
+        style.unpolish(self.translate_btn)
+        style.polish(self.translate_btn)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             # Check if translated
@@ -269,7 +548,8 @@ class ChapterListItem(QWidget):
                 self.main_window.show_manga_reader(self.manga, self.chapter)
 
 class MangaDetailWindow(QWidget):
-    image_loaded = pyqtSignal(QPixmap)  # Signal for image loading
+    # Number of chapter rows instantiated per scroll step
+    CHAPTER_BATCH_SIZE = 30
     
     def __init__(self, parent, manga):
         super().__init__(parent)
@@ -280,14 +560,36 @@ class MangaDetailWindow(QWidget):
         # Get translator service instance
         self.translator = MangaTranslatorService.get_instance()
         
-        # Create details loader
-        self.details_loader = MangaDetailsLoader()
+        # Shared details loader
+        self.details_loader = MangaDetailsLoader.get_instance()
         self.details_loader.finished.connect(self._on_details_loaded)
         self.details_loader.error.connect(self._on_load_error)
         
-        # Connect image loading signal
-        self.image_loaded.connect(self._on_image_loaded)
+        # Single queue-status connection for the whole window; updates
+        # are dispatched to the chapter rows registered here. Bursts of
+        # status ticks are coalesced so the rows repaint at most once
+        # per timer interval.
+        self._chapter_items = {}  # chapter number -> ChapterListItem
+        self._latest_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._apply_latest_status)
+        self.translator.queue_status_changed.connect(self._on_queue_status_changed)
         
+        # Chapter rows are built lazily while scrolling
+        self._pending_chapters = []
+        self._built_count = 0
+        self._chapter_status = {}  # chapter number -> (downloaded, translated)
+
+        # Set when the user leaves this window; in-flight cover workers
+        # capture the event and stop at their next checkpoint
+        self._cancelled = threading.Event()
+
+        # Bumped by update_manga; results stamped with an older
+        # generation are dropped instead of overwriting the new manga's
+        self._load_gen = 0
+
         # Create title label for header
         self.title_label = QLabel(self.manga.title)
         
@@ -300,13 +602,13 @@ class MangaDetailWindow(QWidget):
         self.setup_header(self.main_layout)  # Fixed header
         self.setup_scrollable_content(self.main_layout)  # Scrollable content
         
-        # Apply styles
-        self.apply_styles()
+        # One pre-built sheet per window; see MANGA_DETAIL_QSS
+        self.setStyleSheet(MANGA_DETAIL_QSS)
         
         # Load details and cover image
         self.load_manga_details()
-        threading.Thread(target=self._load_cover_image, daemon=True).start()
-    
+        self._start_cover_load()
+
     def update_manga(self, manga):
         """Update the window with new manga data"""
         self.manga = manga
@@ -316,39 +618,49 @@ class MangaDetailWindow(QWidget):
         self.manga_title.setText(manga.title)
         
         # Update content section
-        stars = int(manga.rating * 5 / 10)
-        rating_text = "★" * stars + "☆" * (5 - stars)
-        self.rating_label.setText(f"{rating_text} ({manga.rating}/10)")
+        self.rating_label.setText(_format_rating(manga.rating))
         
         # Reset chapter count and list
         self.chapter_count.setText("Loading chapters...")
-        while self.chapters_layout.count():
-            child = self.chapters_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self._pending_chapters = []
+        self._built_count = 0
+        self._clear_chapter_rows()
         
         # Clear description if exists
         if hasattr(self, 'description_label'):
             self.description_label.setText("")
         
-        # Reset cover image
+        # Reset cover image (drop the in-flight guard so the new manga's
+        # cover load is not skipped)
         self.cover_label.setText("Loading...")
-        
+        self._cover_loading = False
+
+        # Abandon any load still running for the previous manga; workers
+        # hold a reference to the old event, so swap in a fresh one
+        self._cancelled.set()
+        self._cancelled = threading.Event()
+        self._load_gen += 1
+
         # Load new details and cover image
         self.load_manga_details()
-        threading.Thread(target=self._load_cover_image, daemon=True).start()
+        self._start_cover_load()
     
     def setup_scrollable_content(self, parent_layout):
         # Create scroll area
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #121212;
-            }
-        """)
+        scroll_area.setObjectName("detailScroll")
+        self.scroll_area = scroll_area
+
+        # Build chapter rows on demand as the view scrolls towards them
+        bar = scroll_area.verticalScrollBar()
+        bar.valueChanged.connect(self._on_content_scrolled)
+        # A resize can absorb the whole built range without any scroll
+        # movement; re-check on range changes so rows keep flowing in
+        bar.rangeChanged.connect(
+            lambda _min, _max: self._on_content_scrolled(bar.value())
+        )
         
         # Create container for scrollable content
         scroll_content = QWidget()
@@ -366,12 +678,7 @@ class MangaDetailWindow(QWidget):
     
     def setup_header(self, parent_layout):
         header = QFrame()
-        header.setStyleSheet("""
-            QFrame {
-                background-color: #1E1E1E;
-                border-bottom: 1px solid #333333;
-            }
-        """)
+        header.setObjectName("detailHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(16, 8, 16, 8)
         
@@ -383,12 +690,7 @@ class MangaDetailWindow(QWidget):
         
         # Modified title label
         self.title_label.setWordWrap(False)  # Single line
-        self.title_label.setStyleSheet("""
-            font-size: 18pt; 
-            font-weight: bold; 
-            color: #FFFFFF;
-            border: 0px;
-        """)
+        self.title_label.setObjectName("headerTitle")
         self.title_label.setMinimumHeight(50)
         # Set maximum width to enable automatic elision
         self.title_label.setMaximumWidth(800)
@@ -403,12 +705,7 @@ class MangaDetailWindow(QWidget):
     
     def setup_content(self, parent_layout):
         content = QFrame()
-        content.setStyleSheet("""
-            QFrame {
-                background-color: #121212;
-                margin: 16px;
-            }
-        """)
+        content.setObjectName("detailContent")
         content_layout = QHBoxLayout(content)
         content_layout.setContentsMargins(24, 24, 24, 24)
         content_layout.setSpacing(24)
@@ -417,11 +714,7 @@ class MangaDetailWindow(QWidget):
         self.cover_label = QLabel("Loading...")
         self.cover_label.setFixedSize(300, 400)
         self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cover_label.setStyleSheet("""
-            QLabel {
-                background-color: #2D2D2D;
-            }
-        """)
+        self.cover_label.setObjectName("coverLabel")
         content_layout.addWidget(self.cover_label)
         
         # Right side - Details
@@ -431,79 +724,49 @@ class MangaDetailWindow(QWidget):
         # Title
         self.manga_title = QLabel(self.manga.title)
         self.manga_title.setWordWrap(True)
-        self.manga_title.setStyleSheet("""
-            font-size: 24pt; 
-            font-weight: bold; 
-            color: #FFFFFF;
-            border: 0px;
-        """)
+        self.manga_title.setObjectName("mangaTitle")
         self.manga_title.setMinimumHeight(80)
         self.manga_title.setAlignment(Qt.AlignmentFlag.AlignTop)
         details.addWidget(self.manga_title)
         
         # Rating
         rating_widget = QWidget()
-        rating_widget.setStyleSheet("background-color: transparent;border: 0px;")
+        rating_widget.setObjectName("ratingWidget")
         rating_layout = QHBoxLayout(rating_widget)
         rating_layout.setContentsMargins(0, 0, 0, 0)
         
-        stars = int(self.manga.rating * 5 / 10)
-        rating_text = "★" * stars + "☆" * (5 - stars)
-        self.rating_label = QLabel(f"{rating_text} ({self.manga.rating}/10)")
-        self.rating_label.setStyleSheet("font-size: 16pt; color: #FFC107;border: 0px;")
+        self.rating_label = QLabel(_format_rating(self.manga.rating))
+        self.rating_label.setObjectName("ratingLabel")
         rating_layout.addWidget(self.rating_label)
         rating_layout.addStretch()
         details.addWidget(rating_widget)
         
         # Chapter count
         self.chapter_count = QLabel("Loading chapters...")
-        self.chapter_count.setStyleSheet("font-size: 14pt; color: #B0B0B0;border: 0px;")
+        self.chapter_count.setObjectName("chapterCount")
         details.addWidget(self.chapter_count)
         
         # Description
         self.description_label = QLabel()
         self.description_label.setWordWrap(True)
-        self.description_label.setStyleSheet("""
-            color: #9E9E9E; 
-            font-size: 12pt; 
-            line-height: 1.5;
-            border: 0px;
-        """)
+        self.description_label.setObjectName("descriptionLabel")
         details.addWidget(self.description_label)
         
         details.addStretch()
         content_layout.addLayout(details)
         
         parent_layout.addWidget(content)
-        
-        # Load cover image
-        threading.Thread(target=self._load_cover_image, daemon=True).start()
     
     def setup_chapter_list(self, parent_layout):
         chapter_container = QFrame()
-        chapter_container.setStyleSheet("""
-            QFrame {
-                background-color: #1E1E1E;
-                margin: 0 16px 16px 16px;
-                border-radius: 8px;
-                border: 1px solid #333333;
-            }
-        """)
+        chapter_container.setObjectName("chapterContainer")
         chapter_layout = QVBoxLayout(chapter_container)
         chapter_layout.setContentsMargins(0, 0, 0, 0)
         chapter_layout.setSpacing(0)
         
         # Chapter list header
         list_header = QLabel("Chapters")
-        list_header.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: #FFFFFF;
-            padding-top: 16px;
-            padding-bottom: 16px;
-            border: 0px;
-            background-color: transparent;
-        """)
+        list_header.setObjectName("chapterListHeader")
         chapter_layout.addWidget(list_header)
         
         # Create chapters container
@@ -515,62 +778,164 @@ class MangaDetailWindow(QWidget):
         chapter_layout.addWidget(self.chapters_container)
         parent_layout.addWidget(chapter_container)
     
-    def _load_cover_image(self):
+    def _start_cover_load(self):
+        """Serve the cover from QPixmapCache or fetch it on the pool"""
+        pm = QPixmap()
+        if QPixmapCache.find(f"cover:{self.manga.url}", pm):
+            self.cover_label.setPixmap(pm)
+            return
+        if not self.manga.url.startswith('http'):
+            # Local file: cheap enough to decode synchronously, no
+            # worker thread or queued event round-trip needed
+            self._load_cover_local()
+            return
+        # Guard against a second load being kicked off for the same
+        # window while one is still in flight
+        if getattr(self, '_cover_loading', False):
+            return
+        self._cover_loading = True
+        TaskPool.get_instance().submit(
+            self._load_cover_image, self._cancelled, self._load_gen
+        )
+
+    def _load_cover_local(self):
+        """Load a local manga's cover from disk on the GUI thread"""
+        cover_path = os.path.join(
+            self.translator.base_dir,
+            self.manga.title,
+            "cover.jpg"
+        )
+        pixmap = QPixmap(cover_path)
+        if pixmap.isNull():
+            self.cover_label.setText("No Cover\nAvailable")
+            return
+        pixmap = pixmap.scaled(
+            300, 400,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self.cover_label.setPixmap(pixmap)
+        QPixmapCache.insert(f"cover:{self.manga.url}", pixmap)
+
+    def _load_cover_image(self, cancel_event, gen):
+        """Fetch and decode a remote cover on a pool worker"""
         try:
-            if not self.manga.url.startswith('http'):
-                # Load local cover image
-                cover_path = os.path.join(
-                    self.translator.base_dir,
-                    self.manga.title,
-                    "cover.jpg"
-                )
-                if os.path.exists(cover_path):
-                    pixmap = QPixmap(cover_path)
-                    scaled_pixmap = pixmap.scaled(
-                        300, 400,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    self.image_loaded.emit(scaled_pixmap)
-                    return
-                else:
-                    self.cover_label.setText("No Cover\nAvailable")
-                    return
-            
-            # Load online cover image
-            response = requests.get(self.manga.cover_image)
-            img_data = response.content
-            
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_data)
-            
-            scaled_pixmap = pixmap.scaled(
-                300, 400,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+            if cancel_event.is_set():
+                return
+            if not self.manga.cover_image:
+                self._post_image_failed("Image\nNot Available")
+                return
+
+            # Serve the pre-scaled thumbnail from the disk cache on
+            # warm opens
+            cached = cover_cache.get(self.manga.cover_image,
+                                     max_age=COVER_CACHE_TTL)
+            if cached is None:
+                cached = self._fetch_cover(self.manga.cover_image,
+                                           cancel_event)
+            if cancel_event.is_set():
+                return
+            if cached is None:
+                self._post_image_failed("Image\nNot Available")
+                return
+
+            # Marshal to the GUI thread with a queued invokeMethod call;
+            # the bytes are already a pre-scaled thumbnail, so the GUI
+            # thread only pays for loadFromData. The generation stamp
+            # lets the slot drop results queued before an update_manga.
+            QMetaObject.invokeMethod(
+                self, "_on_image_loaded",
+                Qt.ConnectionType.QueuedConnection,
+                Q_ARG(QByteArray, QByteArray(cached)),
+                Q_ARG(int, gen)
             )
-            
-            self.image_loaded.emit(scaled_pixmap)
-            
+
         except Exception as e:
             logger.error(f"Error loading cover image: {e}")
-            self.cover_label.setText("Image\nNot Available")
-    
-    def _on_image_loaded(self, pixmap):
+            self._post_image_failed("Image\nNot Available")
+
+    @classmethod
+    def _fetch_cover(cls, url: str, cancel_event=None):
+        """Download, downscale and disk-cache a cover, deduplicating
+        concurrent requests for the same URL; returns thumbnail bytes
+        or None on failure or cancellation"""
+        with _cover_inflight_lock:
+            event = _cover_inflight.get(url)
+            if event is None:
+                event = threading.Event()
+                _cover_inflight[url] = event
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            # Another worker is already downloading this cover; wait for
+            # it and reuse the thumbnail it cached
+            event.wait()
+            return cover_cache.get(url)
+
+        try:
+            # Stream the cover image in 64 KB chunks (connect, read
+            # timeouts so a stalled origin can't pin a pool worker)
+            buf = BytesIO()
+            with http_client.SESSION.get(
+                url, stream=True, timeout=http_client.DEFAULT_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    if cancel_event is not None and cancel_event.is_set():
+                        # Abandon the transfer; waiters fall back to a
+                        # cache miss
+                        return None
+                    buf.write(chunk)
+                    if buf.tell() > COVER_MAX_BYTES:
+                        raise IOError(
+                            f"Cover exceeds {COVER_MAX_BYTES} bytes: {url}"
+                        )
+            thumb = cover_cache.make_thumbnail(buf.getvalue())
+            cover_cache.put(url, thumb)
+            return thumb
+        except Exception as e:
+            logger.error(f"Error downloading cover image: {e}")
+            return None
+        finally:
+            with _cover_inflight_lock:
+                _cover_inflight.pop(url, None)
+            event.set()
+
+    def _post_image_failed(self, text):
+        """Queue placeholder text onto the GUI thread from a worker"""
+        QMetaObject.invokeMethod(
+            self, "_on_image_failed",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, text)
+        )
+
+    @pyqtSlot(QByteArray, int)
+    def _on_image_loaded(self, img_data, gen):
         """Update image in main thread"""
+        self._cover_loading = False
+        if gen != self._load_gen:
+            # Stale delivery from before the last update_manga
+            return
+        pixmap = QPixmap()
+        pixmap.loadFromData(img_data)
         self.cover_label.setPixmap(pixmap)
+        QPixmapCache.insert(f"cover:{self.manga.url}", pixmap)
+
+    @pyqtSlot(str)
+    def _on_image_failed(self, text):
+        """Show placeholder text in main thread"""
+        self._cover_loading = False
+        self.cover_label.setText(text)
     
     def load_manga_details(self):
         if not self.manga.url.startswith('http'):
             # Load details from local storage
             self._load_local_manga_details()
         else:
-            # Load details from web
-            threading.Thread(
-                target=self.details_loader.load_details,
-                args=(self.manga,),
-                daemon=True
-            ).start()
+            # Load details from web (cached across window opens)
+            self.details_loader.fetch(self.manga)
     
     def _load_local_manga_details(self):
         """Load manga details from local storage"""
@@ -581,12 +946,15 @@ class MangaDetailWindow(QWidget):
             # Get manga ID from title (for local manga)
             manga_dir = os.path.join(translator.base_dir, self.manga.title)
             
-            # Load manga info
+            # Load manga info (cached per path+mtime across opens)
             info_path = os.path.join(manga_dir, "manga-info.txt")
-            if os.path.exists(info_path):
-                with open(info_path, 'r', encoding='utf-8') as f:
-                    info = json.load(f)
-                    
+            try:
+                info = _load_manga_info(info_path,
+                                        os.stat(info_path).st_mtime_ns)
+            except (OSError, ValueError):
+                info = {}
+
+            if info:
                 # Update manga details
                 self.manga.description = info.get('description', '')
                 self.manga.genres = info.get('genres', [])
@@ -594,22 +962,31 @@ class MangaDetailWindow(QWidget):
             
             # Get chapters from directory
             chapters = []
-            chapter_pattern = r'chapter_(\d+(?:\.\d+)?).zip'
-            for file in os.listdir(manga_dir):
-                match = re.match(chapter_pattern, file)
-                if match:
-                    chapter_num = float(match.group(1))
-                    chapters.append(Chapter(
-                        title=f"Chapter {chapter_num}",
-                        url="",
-                        number=chapter_num,
-                        manga_title=self.manga.title,
-                        manga_id=self.manga.title,
-                        manga_cover=self.manga.cover_image
-                    ))
+            with os.scandir(manga_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Cheap prefilter; the regex only runs on plausible
+                    # chapter archives
+                    if not (name.startswith('chapter_') and
+                            name.endswith('.zip')):
+                        continue
+                    match = _CHAPTER_ZIP_RE.match(name)
+                    if match:
+                        chapter_num = float(match.group(1))
+                        chapters.append(Chapter(
+                            title=f"Chapter {chapter_num}",
+                            url="",
+                            number=chapter_num,
+                            manga_title=self.manga.title,
+                            manga_id=self.manga.title,
+                            manga_cover=self.manga.cover_image
+                        ))
             
-            # Sort chapters and update manga
-            self.manga.chapters = sorted(chapters, key=lambda x: x.number)
+            # Sort once at ingestion (newest first); UI refreshes just
+            # iterate the list, and other consumers sort their own
+            # copies
+            chapters.sort(key=attrgetter('number'), reverse=True)
+            self.manga.chapters = chapters
             
             # Update UI
             self._update_ui_with_details()
@@ -618,8 +995,14 @@ class MangaDetailWindow(QWidget):
             logger.error(f"Error loading local manga details: {e}")
             self._show_loading_error()
     
-    def _on_details_loaded(self, details):
+    def _on_details_loaded(self, url):
         """Handle loaded details in main thread"""
+        if url != self.manga.url:
+            return
+        details = self.details_loader.result(url)
+        if details is None:
+            self._show_loading_error()
+            return
         self.manga.chapters = details.get('chapters', [])
         self.manga.description = details.get('description', '')
         self.manga.genres = details.get('genres', [])
@@ -631,156 +1014,184 @@ class MangaDetailWindow(QWidget):
         url = self.manga.url.rstrip('/')  # Remove trailing slash if present
         return url.split('/')[-1]
     
-    def _on_load_error(self, error_msg):
+    def _on_load_error(self, url, error_msg):
         """Handle error in main thread"""
+        if url != self.manga.url:
+            return
         self._show_loading_error()
         logger.error(f"Error loading manga details: {error_msg}")
     
     def _update_ui_with_details(self):
         # Update chapter count
         self.chapter_count.setText(f"Chapters: {len(self.manga.chapters)}")
-        
+
         # Clear existing chapters
-        while self.chapters_layout.count():
-            child = self.chapters_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Add chapters in reverse order (newest first)
-        for chapter in sorted(self.manga.chapters, key=lambda x: x.number, reverse=True):
-            chapter_item = ChapterListItem(chapter, self.manga, self.main_window)
-        
-            
-            # Check if chapter is translated
-            is_translated = self.translator.is_translated(chapter, self.manga.url)
-            
+        self._clear_chapter_rows()
+
+        # Chapters arrive already sorted newest-first from ingestion;
+        # rows are only instantiated as the user scrolls towards them
+        self._pending_chapters = list(self.manga.chapters)
+        self._built_count = 0
+
+        # One directory scan answers downloaded/translated for every
+        # chapter instead of per-row filesystem probes
+        self._chapter_status = self.translator.scan_status(self.manga.url)
+
+        # Add stretch at the end to push all items to the top
+        self.chapters_layout.addStretch()
+
+        # Build the first screenful up-front, then keep going while the
+        # content still fits the viewport: with no scroll range the
+        # scrollbar never fires and later rows would be unreachable on
+        # tall monitors
+        self._build_chapter_rows(self.CHAPTER_BATCH_SIZE)
+        content = self.scroll_area.widget()
+        viewport = self.scroll_area.viewport()
+        while (self._built_count < len(self._pending_chapters)
+               and content.sizeHint().height() <= viewport.height()):
+            self._build_chapter_rows(self.CHAPTER_BATCH_SIZE)
+
+    def _clear_chapter_rows(self):
+        """Tear down the built chapter rows in one repaint.
+
+        Only rows the lazy builder actually instantiated exist here, so
+        the cost is bounded by how far the user scrolled, not by the
+        series length.
+
+        Reparenting the whole layout onto a throwaway widget drops the
+        entire row tree in one C++ call instead of a takeAt/deleteLater
+        round-trip per row.
+        """
+        self._chapter_items.clear()
+        QWidget().setLayout(self.chapters_layout)
+        self.chapters_layout = QVBoxLayout(self.chapters_container)
+        self.chapters_layout.setContentsMargins(0, 0, 0, 0)
+        self.chapters_layout.setSpacing(1)
+
+    def _on_content_scrolled(self, value):
+        """Instantiate more chapter rows when nearing the built ones"""
+        if self._built_count >= len(self._pending_chapters):
+            return
+
+        bar = self.scroll_area.verticalScrollBar()
+        remaining = bar.maximum() - value
+        if remaining <= 2 * self.scroll_area.viewport().height():
+            self._build_chapter_rows(self.CHAPTER_BATCH_SIZE)
+
+    def _build_chapter_rows(self, count):
+        """Append up to `count` chapter rows ahead of the trailing stretch"""
+        batch = self._pending_chapters[self._built_count:self._built_count + count]
+        insert_at = self.chapters_layout.count() - 1  # keep stretch last
+
+        # Suspend painting so the batch triggers one relayout, not one
+        # per inserted widget
+        self.chapters_container.setUpdatesEnabled(False)
+        try:
+            self._insert_chapter_rows(batch, insert_at)
+        finally:
+            self.chapters_container.setUpdatesEnabled(True)
+            self.chapters_container.updateGeometry()
+
+        self._built_count += len(batch)
+
+    def _insert_chapter_rows(self, batch, insert_at):
+        for chapter in batch:
+            chapter_item = ChapterListItem(
+                chapter, self.manga, self.main_window,
+                translator=self.translator
+            )
+            self._chapter_items[chapter.number] = chapter_item
+
+            # Check if chapter is translated (batched scan, no per-row
+            # filesystem access)
+            _, is_translated = self._chapter_status.get(
+                chapter.number, (False, False)
+            )
+
             # Update button state if translated
             if is_translated:
                 chapter_item.translate_btn.setEnabled(False)
                 chapter_item.translate_btn.setText("Translated")
-                chapter_item.translate_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: none;
-                        padding: 4px 8px;
-                        border-radius: 3px;
-                        font-size: 11px;
-                    }
-                    QPushButton:disabled {
-                        background-color: #4CAF50;
-                        color: white;
-                        opacity: 0.7;
-                    }
-                """)
-            
+                chapter_item._set_button_state('done')
+
             # Add chapter item
-            self.chapters_layout.addWidget(chapter_item)
-            
+            self.chapters_layout.insertWidget(insert_at, chapter_item)
+            insert_at += 1
+
             # Add separator
             separator = QFrame()
             separator.setFrameShape(QFrame.Shape.HLine)
             separator.setFixedHeight(2)
-            separator.setStyleSheet("background-color: #B5B5B5; border: 1px solid #B5B5B5;")
-            self.chapters_layout.addWidget(separator)
-            
-            
-        
-        # Add stretch at the end to push all items to the top
-        self.chapters_layout.addStretch()
+            separator.setObjectName("chapterSeparator")
+            self.chapters_layout.insertWidget(insert_at, separator)
+            insert_at += 1
+    
+    def _on_queue_status_changed(self, status: QueueStatus):
+        """Stash the newest status and arm the coalescing timer"""
+        self._latest_status = status
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _apply_latest_status(self):
+        """Fan out the most recent status collected during the burst"""
+        status = self._latest_status
+        if status is None:
+            return
+        self._latest_status = None
+        self._dispatch_queue_status(status)
+
+    def _dispatch_queue_status(self, status: QueueStatus):
+        """Fan a queue status update out to the built chapter rows.
+
+        The queue is digested once into current-task numbers and queued
+        sets, so the per-row work is O(1) instead of a walk over the
+        queued chapters for every row.
+        """
+        current_download = None
+        current_translation = None
+        if status.current_task:
+            if isinstance(status.current_task, DownloadTask):
+                current_download = status.current_task.chapter.number
+            elif isinstance(status.current_task, TranslationTask):
+                current_translation = status.current_task.chapter.number
+
+        download_queued = set()
+        translation_queued = set()
+        for task in status.queued_chapters:
+            if isinstance(task, DownloadTask):
+                download_queued.add(task.chapter.number)
+            elif isinstance(task, TranslationTask):
+                translation_queued.add(task.chapter.number)
+
+        # Refresh translated-state with one batched scan rather than
+        # letting each row probe the filesystem itself
+        self._chapter_status = self.translator.scan_status(self.manga.url)
+        translated = {
+            number for number, (_, is_translated)
+            in self._chapter_status.items() if is_translated
+        }
+
+        for item in self._chapter_items.values():
+            item.apply_status(current_download, current_translation,
+                              download_queued, translation_queued,
+                              translated)
     
     def _show_loading_error(self):
         self.chapter_count.setText("Error loading chapters")
     
     def go_back(self):
+        # Leaving the window: reclaim the worker running its cover load
+        self._cancelled.set()
         self.parent.show_main_view()
-    
-    def apply_styles(self):
-        # Dark theme colors
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #121212;
-                color: #E0E0E0;
-            }
-            
-            QFrame {
-                background-color: #1E1E1E;
-                border: 1px solid #333333;
-            }
-            
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-            
-            QListWidget {
-                background-color: #1E1E1E;
-                border: none;
-            }
-            
-            QListWidget::item {
-                background-color: #1E1E1E;
-                border-bottom: 1px solid #333333;
-            }
-            
-            QListWidget::item:hover {
-                background-color: #2D2D2D;
-            }
-            
-            QScrollArea {
-                border: none;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #1E1E1E;
-                width: 12px;
-                margin: 0;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #424242;
-                min-height: 20px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #4F4F4F;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background-color: #1E1E1E;
-            }
-        """)
-    
+
+    def closeEvent(self, event):
+        self._cancelled.set()
+        super().closeEvent(event)
+
     def start_translation(self):
-        for chapter_item in self.chapters_layout:
+        # Iterate the chapter-row registry; a QVBoxLayout itself is not
+        # iterable, so looping over it raises TypeError
+        for chapter_item in self._chapter_items.values():
             if chapter_item.is_translating:
                 chapter_item.start_translation()
-    
-    def update_download_progress(self, value):
-        for chapter_item in self.chapters_layout:
-            chapter_item.update_download_progress(value)
-    
-    def update_translation_progress(self, value):
-        for chapter_item in self.chapters_layout:
-            chapter_item.update_translation_progress(value)
-    
-    def on_translation_completed(self, path):
-        for chapter_item in self.chapters_layout:
-            chapter_item.on_translation_completed(path)
-    
-    def on_translation_error(self, error_msg):
-        for chapter_item in self.chapters_layout:
-            chapter_item.on_translation_error(error_msg)
 
@@ -1,17 +1,17 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
-import requests
-from PIL import Image
-from PIL.ImageQt import ImageQt
-from io import BytesIO
-import threading
+from PyQt6.QtGui import QImage, QPixmap
 import logging
+from ..task_pool import TaskPool
+from ..http_client import SESSION, DEFAULT_TIMEOUT
+from .. import cover_cache
 
 logger = logging.getLogger(__name__)
 
 class MangaGrid(QWidget):
     clicked = pyqtSignal(object)  # Signal emitted when manga is clicked
+    image_loaded = pyqtSignal(QImage)   # Worker-decoded cover image
+    image_failed = pyqtSignal(str)      # Placeholder text on load failure
     
     def __init__(self, parent, manga):
         super().__init__(parent)
@@ -56,26 +56,50 @@ class MangaGrid(QWidget):
             }
         """)
         
-        # Load image in background
-        threading.Thread(target=self._load_image_async, daemon=True).start()
+        # Deliver results back on the GUI thread
+        self.image_loaded.connect(self._on_image_loaded)
+        self.image_failed.connect(self.cover_label.setText)
+        
+        # Load image on the shared pool
+        TaskPool.get_instance().submit(self._load_image_async)
     
     def _load_image_async(self):
         try:
-            response = requests.get(self.manga.cover_image)
-            img = Image.open(BytesIO(response.content))
-            img = img.resize((150, 200), Image.Resampling.LANCZOS)
-            
-            # Convert PIL image to QPixmap
-            qimg = ImageQt(img)
-            pixmap = QPixmap.fromImage(qimg)
-            
+            # Shared disk cache holds a pre-scaled thumbnail per URL;
+            # only a cold URL downloads and decodes the full cover
+            data = cover_cache.get(self.manga.cover_image)
+            if data is None:
+                # Stream the body straight into the decoder instead of
+                # buffering the whole JPEG first
+                with SESSION.get(self.manga.cover_image, stream=True,
+                                 timeout=DEFAULT_TIMEOUT) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    data = cover_cache.make_thumbnail(response.raw)
+                cover_cache.put(self.manga.cover_image, data)
+
+            # Let Qt's own JPEG/PNG plugin decode the pre-scaled
+            # thumbnail and do the final SIMD downscale — as a QImage,
+            # which unlike QPixmap is safe on the worker thread
+            image = QImage()
+            image.loadFromData(data)
+            image = image.scaled(
+                150, 200,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
             # Update UI in main thread
-            self.cover_label.setPixmap(pixmap)
-            
+            self.image_loaded.emit(image)
+
         except Exception as e:
             logger.error(f"Error loading image for {self.manga.title}: {e}")
-            self.cover_label.setText("Image\nNot Available")
-    
+            self.image_failed.emit("Image\nNot Available")
+
+    def _on_image_loaded(self, image):
+        """Build the pixmap and update the label in the main thread"""
+        self.cover_label.setPixmap(QPixmap.fromImage(image))
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit(self.manga) 
\ No newline at end of file
@@ -1,98 +1,321 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QScrollArea, QFrame)
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer
-from PyQt6.QtGui import QPixmap, QWheelEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRect, QSize, QTimer
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QWheelEvent
 import os
 import logging
+from operator import attrgetter
 from ..manga_translator_service import MangaTranslatorService
+from ..task_pool import TaskPool
 
 logger = logging.getLogger(__name__)
 
+# Chapter page listings keyed by directory, reused while the directory
+# mtime is unchanged so reopening a chapter skips the enumeration
+_dir_cache = {}
+
+
+def _list_chapter_images(directory):
+    """Sorted image file names in a chapter directory, cached per mtime"""
+    mtime = os.stat(directory).st_mtime_ns
+    cached = _dir_cache.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(directory) as entries:
+        names = sorted(e.name for e in entries
+                       if e.name.lower().endswith(('.jpg', '.png', '.jpeg')))
+    _dir_cache[directory] = (mtime, names)
+    return names
+
+# Stylesheets built once at import; every widget instance reuses the
+# same parsed string instead of re-concatenating it per construction
+ZOOM_TOOLTIP_QSS = """
+    QLabel {
+        background-color: rgba(0, 0, 0, 0.7);
+        color: white;
+        padding: 8px;
+        border-radius: 4px;
+    }
+"""
+
+ZOOM_PANEL_QSS = """
+    QFrame {
+        background-color: rgba(30, 30, 30, 0.8);
+        border-radius: 20px;
+    }
+"""
+
+ZOOM_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 20px;
+        font-size: 20px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1E88E5;
+    }
+"""
+
+HEADER_QSS = """
+    QFrame {
+        background-color: #1E1E1E;
+        border-bottom: 1px solid #333333;
+    }
+"""
+
+FOOTER_QSS = """
+    QFrame {
+        background-color: #1E1E1E;
+        border-top: 1px solid #333333;
+    }
+"""
+
+BLUE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #1E88E5;
+    }
+    QPushButton:disabled {
+        background-color: #424242;
+        color: #808080;
+    }
+"""
+
+TOGGLE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #43A047;
+    }
+    QPushButton:checked {
+        background-color: #FF5722;
+    }
+"""
+
 class ZoomableImage(QLabel):
+    # Decoded on a pool worker, delivered back on the GUI thread
+    image_decoded = pyqtSignal(QImage)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scale_factor = 1.0
         self.original_pixmap = None
+        # Set when the scale changed while the page was off-screen; the
+        # scroll area rescales dirty pages as they come into view
+        self._dirty = False
+        # Lazy-loading state: pages hold their file path and only
+        # decode once scrolled near the viewport
+        self._img_path = None
+        self._loaded = False
+        self._scale_initialized = False
+        self._destroyed = False
+        self.destroyed.connect(self._on_destroyed)
+        self.image_decoded.connect(self._on_image_decoded)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Define zoom limits
         self.MIN_ZOOM = 0.75  # 75%
         self.MAX_ZOOM = 2.0   # 200%
     
+    def set_image_path(self, path):
+        """Register the page without decoding it yet, reserving a
+        typical page height so the scrollbar range is usable"""
+        self._img_path = path
+        self._loaded = False
+        width = self.parent().width() if self.parent() else 800
+        self.setMinimumHeight(int(max(width, 1) * 1.4))
+
+    def _on_destroyed(self):
+        self._destroyed = True
+
+    def ensure_loaded(self):
+        """Decode the page on a pool worker on first approach to the
+        viewport, keeping the GUI thread free of file decodes"""
+        if self._loaded or not self._img_path:
+            return
+        self._loaded = True
+        # Decoding at twice the container width keeps MAX_ZOOM (200%)
+        # pixel-exact while letting libjpeg skip most IDCT work on
+        # oversized sources; width is read here, on the GUI thread
+        max_width = (self.parent().width() if self.parent() else 0) * 2
+        TaskPool.get_instance().submit(
+            self._decode_async, self._img_path, max_width)
+
+    def _decode_async(self, path, max_width):
+        # QImage decoding is safe off the GUI thread; QPixmap is not
+        reader = QImageReader(path)
+        size = reader.size()
+        if max_width > 0 and size.isValid() and size.width() > max_width:
+            reader.setScaledSize(QSize(
+                max_width, size.height() * max_width // size.width()))
+        image = reader.read()
+        if not self._destroyed:
+            self.image_decoded.emit(image)
+
+    def _on_image_decoded(self, image):
+        if self._destroyed or image.isNull():
+            return
+        self.set_image(QPixmap.fromImage(image))
+
+    def release_pixmap(self):
+        """Drop the decoded frame for a page far off-screen; the label
+        keeps its height so the scroll position doesn't jump"""
+        if not self._loaded or not self._img_path:
+            return
+        self.setMinimumHeight(self.height())
+        self._loaded = False
+        self.original_pixmap = None
+        self.clear()
+
     def set_image(self, pixmap):
         self.original_pixmap = pixmap
-        # Calculate initial scale to fit window width
-        if self.parent():
+        self.setMinimumHeight(0)
+        # Calculate initial scale to fit window width; a page reloaded
+        # after release_pixmap keeps the zoom the user chose
+        if not self._scale_initialized and self.parent():
             container_width = self.parent().width()
             if container_width > 0:
                 # Calculate scale factor to fit window
                 self.scale_factor = min(1.0, container_width / pixmap.width())
+                self._scale_initialized = True
         
         # Schedule update for after widget is properly parented
         QTimer.singleShot(0, self.update_scaled_pixmap)
     
-    def update_scaled_pixmap(self):
+    def update_scaled_pixmap(self, fast=False):
+        """Rescale to the current factor; `fast` trades quality for a
+        nearest-neighbour pass during live zooming, with the smooth
+        version produced on settle"""
+        self._dirty = False
         if self.original_pixmap and self.parent():
+            # Reuse an already-produced scale of this page if the user
+            # has zoomed through this level before; the smooth scale is
+            # a full-frame CPU pass worth skipping on repeats
+            key = (f"zoom:{self.original_pixmap.cacheKey()}"
+                   f":{round(self.scale_factor, 2)}")
+            cached = QPixmapCache.find(key)
+            if cached is not None and not cached.isNull():
+                self.setPixmap(cached)
+                return
+
             # Calculate scaled size based on original image size
             scaled_width = int(self.original_pixmap.width() * self.scale_factor)
             scaled_height = int(self.original_pixmap.height() * self.scale_factor)
-            
+
             # Scale image
             scaled_pixmap = self.original_pixmap.scaled(
                 scaled_width,
                 scaled_height,
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+                Qt.TransformationMode.FastTransformation if fast
+                else Qt.TransformationMode.SmoothTransformation
             )
+            # Only final-quality frames go in the cache
+            if not fast:
+                QPixmapCache.insert(key, scaled_pixmap)
             self.setPixmap(scaled_pixmap)
     
     def get_zoom_percentage(self):
         """Get current zoom level as percentage"""
         return self.scale_factor * 100
     
-    def zoom(self, factor):
+    def zoom(self, factor, rescale=True, fast=False):
         new_scale = self.scale_factor * factor
         # Limit zoom range between MIN_ZOOM and MAX_ZOOM
         if self.MIN_ZOOM <= new_scale <= self.MAX_ZOOM:
             self.scale_factor = new_scale
-            self.update_scaled_pixmap()
+            if rescale:
+                self.update_scaled_pixmap(fast=fast)
+            else:
+                self._dirty = True
 
 class ZoomableScrollArea(QScrollArea):
+    # One hide timer shared by every instance; it hides whichever
+    # tooltip was shown last
+    _tooltip_timer = None
+    _active_tooltip = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Populated by the reader after load_images; avoids a full
+        # QObject-tree findChildren walk on every wheel/scroll event
+        self.image_widgets = []
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
         # Create tooltip label for zoom limits
         self.zoom_tooltip = QLabel(self)
-        self.zoom_tooltip.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 0.7);
-                color: white;
-                padding: 8px;
-                border-radius: 4px;
-            }
-        """)
+        self.zoom_tooltip.setStyleSheet(ZOOM_TOOLTIP_QSS)
         self.zoom_tooltip.hide()
-        
-        # Timer for hiding tooltip
-        self.tooltip_timer = QTimer(self)
-        self.tooltip_timer.setSingleShot(True)
-        self.tooltip_timer.timeout.connect(self.zoom_tooltip.hide)
-    
+
+        # Coalesce wheel ticks: accumulate the factor and rescale every
+        # page once per burst instead of once per tick
+        self._pending_factor = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+
+        # After a zoom burst lands, replace the fast-scaled frames of
+        # the visible pages with smooth ones
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.timeout.connect(self._smooth_visible_images)
+
+        # Rescale pages marked dirty by off-screen zooms as they scroll
+        # into view
+        self.verticalScrollBar().valueChanged.connect(self._flush_dirty_images)
+
+    def image_in_view(self, image, screens=1):
+        """True if the page intersects the viewport plus `screens`
+        viewport heights of margin either side"""
+        viewport = self.viewport()
+        margin = viewport.height() * screens
+        visible = viewport.rect().adjusted(0, -margin, 0, margin)
+        origin = image.mapTo(viewport, QPoint(0, 0))
+        return visible.intersects(QRect(origin, image.size()))
+
+    def _flush_dirty_images(self, _value=None):
+        """Decode approaching pages, rescale dirty visible ones and
+        release frames that have drifted far off-screen"""
+        for image in self.image_widgets:
+            if self.image_in_view(image):
+                if not image._loaded:
+                    image.ensure_loaded()
+                elif image._dirty:
+                    image.update_scaled_pixmap()
+            elif image._loaded and not self.image_in_view(image, screens=3):
+                image.release_pixmap()
+
     def wheelEvent(self, event: QWheelEvent):
         modifiers = event.modifiers()
         if modifiers == Qt.KeyboardModifier.ControlModifier:
             # Handle zoom
             delta = event.angleDelta().y()
             zoom_factor = 1.1 if delta > 0 else 0.9
-            
+
             # Get first image to check zoom limits
-            first_image = self.widget().findChild(ZoomableImage)
+            first_image = self.image_widgets[0] if self.image_widgets else None
             if first_image:
-                new_scale = first_image.scale_factor * zoom_factor
-                
+                # Check limits against the accumulated (not yet applied)
+                # zoom so a fast burst still stops at the bounds
+                new_scale = (first_image.scale_factor
+                             * self._pending_factor * zoom_factor)
+
                 # Check zoom limits
                 if new_scale > first_image.MAX_ZOOM:
                     self.show_zoom_tooltip("Maximum zoom reached (200%)")
@@ -100,17 +323,34 @@ class ZoomableScrollArea(QScrollArea):
                 elif new_scale < first_image.MIN_ZOOM:
                     self.show_zoom_tooltip("Minimum zoom reached (75%)")
                     return
-                
-                # Apply zoom if within limits
-                for image in self.widget().findChildren(ZoomableImage):
-                    image.zoom(zoom_factor)
-                
-                # Show current zoom level
-                current_zoom = first_image.get_zoom_percentage()
-                self.show_zoom_tooltip(f"Zoom: {current_zoom:.0f}%")
+
+                self._pending_factor *= zoom_factor
+                self._zoom_timer.start(40)
+
+                # Show the zoom level the burst will land on
+                self.show_zoom_tooltip(f"Zoom: {new_scale * 100:.0f}%")
         else:
             # Normal scroll
             super().wheelEvent(event)
+
+    def _apply_pending_zoom(self):
+        """Apply the accumulated wheel factor to every page at once"""
+        factor = self._pending_factor
+        self._pending_factor = 1.0
+        if factor == 1.0:
+            return
+        # Only rescale pages near the viewport; the rest are marked
+        # dirty and caught up on scroll. Use the cheap nearest pass
+        # while zooming, then upgrade to smooth once input settles.
+        for image in self.image_widgets:
+            image.zoom(factor, rescale=self.image_in_view(image), fast=True)
+        self._settle_timer.start(150)
+
+    def _smooth_visible_images(self):
+        """Re-render the visible pages at full quality after a burst"""
+        for image in self.image_widgets:
+            if self.image_in_view(image):
+                image.update_scaled_pixmap()
     
     def show_zoom_tooltip(self, text):
         self.zoom_tooltip.setText(text)
@@ -121,45 +361,44 @@ class ZoomableScrollArea(QScrollArea):
         pos.setX(pos.x() - self.zoom_tooltip.width() // 2)
         pos.setY(pos.y() - self.zoom_tooltip.height() // 2)
         self.zoom_tooltip.move(pos)
-        
+
         self.zoom_tooltip.show()
-        self.tooltip_timer.start(1000)  # Hide after 1 second
+        cls = ZoomableScrollArea
+        if cls._tooltip_timer is None:
+            cls._tooltip_timer = QTimer()
+            cls._tooltip_timer.setSingleShot(True)
+            cls._tooltip_timer.timeout.connect(cls._hide_active_tooltip)
+        cls._active_tooltip = self.zoom_tooltip
+        cls._tooltip_timer.start(1000)  # Hide after 1 second
+
+    @classmethod
+    def _hide_active_tooltip(cls):
+        if cls._active_tooltip is not None:
+            try:
+                cls._active_tooltip.hide()
+            except RuntimeError:
+                # The owning reader was torn down before the timeout
+                pass
+            cls._active_tooltip = None
 
 class ZoomControls(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: rgba(30, 30, 30, 0.8);
-                border-radius: 20px;
-            }
-        """)
-        
+        self.setStyleSheet(ZOOM_PANEL_QSS)
+
         layout = QVBoxLayout(self)
         layout.setSpacing(4)
-        
+
         # Zoom in button
         self.zoom_in_btn = QPushButton("+")
         self.zoom_in_btn.setFixedSize(40, 40)
-        self.zoom_in_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 20px;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-        """)
+        self.zoom_in_btn.setStyleSheet(ZOOM_BUTTON_QSS)
         layout.addWidget(self.zoom_in_btn)
         
         # Zoom out button
         self.zoom_out_btn = QPushButton("-")
         self.zoom_out_btn.setFixedSize(40, 40)
-        self.zoom_out_btn.setStyleSheet(self.zoom_in_btn.styleSheet())
+        self.zoom_out_btn.setStyleSheet(ZOOM_BUTTON_QSS)
         layout.addWidget(self.zoom_out_btn)
         
         # Position in top left corner
@@ -181,31 +420,15 @@ class ZoomControls(QFrame):
 class StickyHeader(QFrame):
     def __init__(self, chapter_num, total_pages, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1E1E1E;
-                border-bottom: 1px solid #333333;
-            }
-        """)
-        
+        self.setStyleSheet(HEADER_QSS)
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 8, 16, 8)
-        
+
         # Back button
         self.back_btn = QPushButton("← Back")
         self.back_btn.setFixedWidth(100)
-        self.back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-        """)
+        self.back_btn.setStyleSheet(BLUE_BUTTON_QSS)
         layout.addWidget(self.back_btn)
         
         # Chapter info
@@ -218,21 +441,7 @@ class StickyHeader(QFrame):
         self.toggle_btn = QPushButton("Show Raw")
         self.toggle_btn.setFixedWidth(120)
         self.toggle_btn.setCheckable(True)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #43A047;
-            }
-            QPushButton:checked {
-                background-color: #FF5722;
-            }
-        """)
+        self.toggle_btn.setStyleSheet(TOGGLE_BUTTON_QSS)
         layout.addWidget(self.toggle_btn)
     
     def update_page(self, current_page, total_pages):
@@ -241,35 +450,15 @@ class StickyHeader(QFrame):
 class StickyFooter(QFrame):
     def __init__(self, current_chapter, total_chapters, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1E1E1E;
-                border-top: 1px solid #333333;
-            }
-        """)
-        
+        self.setStyleSheet(FOOTER_QSS)
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 8, 16, 8)
-        
+
         # Previous chapter button
         self.prev_btn = QPushButton("Previous Chapter")
         self.prev_btn.setFixedWidth(150)
-        self.prev_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1E88E5;
-            }
-            QPushButton:disabled {
-                background-color: #424242;
-                color: #808080;
-            }
-        """)
+        self.prev_btn.setStyleSheet(BLUE_BUTTON_QSS)
         layout.addWidget(self.prev_btn)
         
         # Chapter info
@@ -281,7 +470,7 @@ class StickyFooter(QFrame):
         # Next chapter button
         self.next_btn = QPushButton("Next Chapter")
         self.next_btn.setFixedWidth(150)
-        self.next_btn.setStyleSheet(self.prev_btn.styleSheet())
+        self.next_btn.setStyleSheet(BLUE_BUTTON_QSS)
         layout.addWidget(self.next_btn)
     
     def update_navigation(self, prev_chapter=None, next_chapter=None):
@@ -308,14 +497,27 @@ class MangaReader(QWidget):
         
         # Get translator service
         self.translator = MangaTranslatorService.get_instance()
-        
+
+        # One directory scan answers "is translated" for every chapter;
+        # navigation and the footer total reuse this set instead of
+        # probing the filesystem per chapter
+        self._translated_numbers = {
+            number for number, (_, translated)
+            in self.translator.scan_status(manga.url).items() if translated
+        }
+
+        # Sorted once; every navigation click reuses this instead of
+        # re-sorting and re-scanning for the current position
+        self._sorted_chapters = sorted(manga.chapters, key=attrgetter('number'))
+        self._current_idx = self._sorted_chapters.index(chapter)
+
         # Setup UI
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        
+
         # Check if chapter is translated
-        if not self.translator.is_translated(chapter, manga.url):
+        if chapter.number not in self._translated_numbers:
             # Show not translated message
             msg = QLabel("This chapter has not been translated yet.")
             msg.setStyleSheet("color: white; font-size: 16pt;")
@@ -328,9 +530,8 @@ class MangaReader(QWidget):
         self.chapter_dir = os.path.join(self.translator.base_dir, manga_id, f"chapter_{chapter.number}")
         self.translated_dir = os.path.join(self.translator.base_dir, manga_id, f"chapter_{chapter.number}_translated")
         
-        # Get image files
-        self.images = sorted([f for f in os.listdir(self.translated_dir) 
-                            if f.lower().endswith(('.jpg', '.png', '.jpeg'))])
+        # Get image files (cached per directory mtime)
+        self.images = _list_chapter_images(self.translated_dir)
         
         # Create header
         self.header = StickyHeader(chapter.number, len(self.images))
@@ -343,15 +544,15 @@ class MangaReader(QWidget):
         self.scroll_area.setStyleSheet("QScrollArea { border: none; background-color: #121212; }")
         
         # Create container for images
-        container = QWidget()
-        self.images_layout = QVBoxLayout(container)
+        self.images_container = QWidget()
+        self.images_layout = QVBoxLayout(self.images_container)
         self.images_layout.setContentsMargins(0, 0, 0, 0)
         self.images_layout.setSpacing(0)
-        
+
         # Load images
         self.load_images()
-        
-        self.scroll_area.setWidget(container)
+
+        self.scroll_area.setWidget(self.images_container)
         layout.addWidget(self.scroll_area)
         
         # Add zoom controls
@@ -360,8 +561,8 @@ class MangaReader(QWidget):
         self.zoom_controls.zoom_out_btn.clicked.connect(lambda: self.zoom_all_images(0.9))
         
         # Create footer
-        total_translated = sum(1 for ch in manga.chapters 
-                             if self.translator.is_translated(ch, manga.url))
+        total_translated = sum(1 for ch in manga.chapters
+                             if ch.number in self._translated_numbers)
         self.footer = StickyFooter(chapter.number, total_translated)
         self.footer.prev_btn.clicked.connect(self.prev_chapter)
         self.footer.next_btn.clicked.connect(self.next_chapter)
@@ -371,34 +572,39 @@ class MangaReader(QWidget):
         self.update_navigation()
     
     def load_images(self):
-        # Clear existing images
-        while self.images_layout.count():
-            child = self.images_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
+        # Drop any previously built pages in one pass by reparenting
+        # the whole layout onto a throwaway widget (mode toggles hit
+        # this), instead of a takeAt/deleteLater loop
+        if self.images_layout.count():
+            QWidget().setLayout(self.images_layout)
+            self.images_layout = QVBoxLayout(self.images_container)
+            self.images_layout.setContentsMargins(0, 0, 0, 0)
+            self.images_layout.setSpacing(0)
+
+
         # Get current directory based on mode
         current_dir = self.translated_dir if self.current_mode == "translated" else self.chapter_dir
         
-        # Add images
+        # Add placeholder pages; decoding happens lazily as each page
+        # nears the viewport instead of all at once on entry
+        self._image_widgets = []
         for img_file in self.images:
             img_path = os.path.join(current_dir, img_file)
             if os.path.exists(img_path):
                 image_label = ZoomableImage()
-                pixmap = QPixmap(img_path)
-                
-                # Scale to window width initially
-                scaled_width = self.width()
-                scaled_pixmap = pixmap.scaledToWidth(
-                    scaled_width,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                image_label.set_image(pixmap)
+                image_label.set_image_path(img_path)
                 self.images_layout.addWidget(image_label)
-        
+                self._image_widgets.append(image_label)
+
         # Add stretch at the end
         self.images_layout.addStretch()
+
+        # Share the page list with the scroll area so event handlers
+        # skip the QObject-tree walk
+        self.scroll_area.image_widgets = self._image_widgets
+
+        # Decode the first screenful once layout has settled
+        QTimer.singleShot(0, self.scroll_area._flush_dirty_images)
     
     def toggle_mode(self):
         self.current_mode = "raw" if self.current_mode == "translated" else "translated"
@@ -407,43 +613,45 @@ class MangaReader(QWidget):
     
     def update_navigation(self):
         # Find previous and next translated chapters
-        chapters = sorted(self.manga.chapters, key=lambda x: x.number)
-        current_idx = chapters.index(self.chapter)
-        
+        chapters = self._sorted_chapters
+        current_idx = self._current_idx
+
         prev_chapter = None
         next_chapter = None
         
         # Look for previous translated chapter
         for ch in reversed(chapters[:current_idx]):
-            if self.translator.is_translated(ch, self.manga.url):
+            if ch.number in self._translated_numbers:
                 prev_chapter = ch.number
                 break
-        
+
         # Look for next translated chapter
         for ch in chapters[current_idx + 1:]:
-            if self.translator.is_translated(ch, self.manga.url):
+            if ch.number in self._translated_numbers:
                 next_chapter = ch.number
                 break
         
         self.footer.update_navigation(prev_chapter, next_chapter)
     
     def prev_chapter(self):
-        chapters = sorted(self.manga.chapters, key=lambda x: x.number)
-        current_idx = chapters.index(self.chapter)
-        
+        chapters = self._sorted_chapters
+        current_idx = self._current_idx
+
+
         # Find previous translated chapter
         for ch in reversed(chapters[:current_idx]):
-            if self.translator.is_translated(ch, self.manga.url):
+            if ch.number in self._translated_numbers:
                 self.parent.show_manga_reader(self.manga, ch)
                 break
     
     def next_chapter(self):
-        chapters = sorted(self.manga.chapters, key=lambda x: x.number)
-        current_idx = chapters.index(self.chapter)
-        
+        chapters = self._sorted_chapters
+        current_idx = self._current_idx
+
+
         # Find next translated chapter
         for ch in chapters[current_idx + 1:]:
-            if self.translator.is_translated(ch, self.manga.url):
+            if ch.number in self._translated_numbers:
                 self.parent.show_manga_reader(self.manga, ch)
                 break
     
@@ -451,12 +659,20 @@ class MangaReader(QWidget):
         self.parent.show_manga_detail(self.manga)
     
     def zoom_all_images(self, factor):
-        """Zoom all images by the given factor"""
-        for image in self.findChildren(ZoomableImage):
-            image.zoom(factor)
-    
+        """Zoom all images by the given factor, rescaling only the
+        pages near the viewport"""
+        for image in self._image_widgets:
+            image.zoom(factor, rescale=self.scroll_area.image_in_view(image))
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # Update image sizes when window resizes
-        for image in self.findChildren(ZoomableImage):
-            image.update_scaled_pixmap() 
\ No newline at end of file
+        # The untranslated-chapter placeholder has no scroll area
+        if not hasattr(self, 'scroll_area'):
+            return
+        # Update image sizes when window resizes; off-screen pages are
+        # deferred until scrolled into view
+        for image in self._image_widgets:
+            if self.scroll_area.image_in_view(image):
+                image.update_scaled_pixmap()
+            else:
+                image._dirty = True
\ No newline at end of file
@@ -1,21 +1,77 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton, QProgressBar, QWidget, QScrollArea)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap
-import requests
-from io import BytesIO
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
 from ..manga_translator_service import MangaTranslatorService, QueueStatus, TranslationTask
+from ..task_pool import TaskPool
+from ..http_client import SESSION, DEFAULT_TIMEOUT
+from .. import cover_cache
+
+# Stylesheets built once at import; each refreshed row reuses the same
+# parsed string instead of rebuilding it per construction
+THUMB_QSS = "background-color: #2D2D2D; border-radius: 5px;"
+
+ITEM_PROGRESS_QSS = """
+    QProgressBar {
+        border: none;
+        background-color: #424242;
+        border-radius: 3px;
+        height: 6px;
+    }
+    QProgressBar::chunk {
+        background-color: #2196F3;
+        border-radius: 3px;
+    }
+"""
+
+STOP_BUTTON_QSS = """
+    QPushButton {
+        background-color: #424242;
+        color: white;
+        border: none;
+        border-radius: 15px;
+        font-size: 16px;
+    }
+    QPushButton:hover {
+        background-color: #FF5252;
+    }
+"""
+
+OVERALL_PROGRESS_QSS = """
+    QProgressBar {
+        border: none;
+        background-color: #424242;
+        border-radius: 3px;
+        height: 8px;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 3px;
+    }
+"""
 
 class QueueItemWidget(QWidget):
+    # Fetched and scaled as a QImage on a pool worker — QImage is safe
+    # off the GUI thread, QPixmap is not — then delivered back here
+    thumb_ready = pyqtSignal(str, QImage)
+    thumb_failed = pyqtSignal()
+
+    # Scaled thumbnail pixmaps shared across every widget and dialog
+    # refresh; each cover URL is fetched and scaled at most once per
+    # run. Built and read on the GUI thread only.
+    _thumb_cache = {}
+
     def __init__(self, task: TranslationTask, parent=None):
         super().__init__(parent)
+        self._destroyed = False
+        self.destroyed.connect(self._on_destroyed)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
         # Thumbnail
         self.thumb = QLabel()
         self.thumb.setFixedSize(50, 70)
-        self.thumb.setStyleSheet("background-color: #2D2D2D; border-radius: 5px;")
+        self.thumb.setStyleSheet(THUMB_QSS)
         layout.addWidget(self.thumb)
         
         # Info container
@@ -31,50 +87,62 @@ class QueueItemWidget(QWidget):
         # Progress bar
         self.progress = QProgressBar()
         self.progress.setFixedWidth(200)
-        self.progress.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background-color: #424242;
-                border-radius: 3px;
-                height: 6px;
-            }
-            QProgressBar::chunk {
-                background-color: #2196F3;
-                border-radius: 3px;
-            }
-        """)
+        self.progress.setStyleSheet(ITEM_PROGRESS_QSS)
         layout.addWidget(self.progress)
         
         # Stop/Delete button
         self.stop_btn = QPushButton("×")
         self.stop_btn.setFixedSize(30, 30)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #424242;
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #FF5252;
-            }
-        """)
+        self.stop_btn.setStyleSheet(STOP_BUTTON_QSS)
         layout.addWidget(self.stop_btn)
         
+        # Deliver results back on the GUI thread
+        self.thumb_ready.connect(self._on_thumb_ready)
+        self.thumb_failed.connect(lambda: self.thumb.setText("N/A"))
+
         # Load thumbnail
         self.load_thumbnail(task.chapter.manga_cover)
-    
+
+    def _on_destroyed(self):
+        self._destroyed = True
+
     def load_thumbnail(self, url):
-        try:
-            response = requests.get(url)
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            scaled = pixmap.scaled(50, 70, Qt.AspectRatioMode.KeepAspectRatio, 
-                                 Qt.TransformationMode.SmoothTransformation)
-            self.thumb.setPixmap(scaled)
-        except:
+        # Warm case: same cover already fetched and scaled this run
+        cached = self._thumb_cache.get(url)
+        if cached is not None:
+            self.thumb.setPixmap(cached)
+            return
+        if not url:
             self.thumb.setText("N/A")
+            return
+        TaskPool.get_instance().submit(self._fetch_thumbnail, url)
+
+    def _fetch_thumbnail(self, url):
+        try:
+            # The grid's disk cache usually already holds a pre-scaled
+            # copy of this cover; only fall back to the network on miss
+            data = cover_cache.get(url)
+            if data is None:
+                response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
+                response.raise_for_status()
+                data = response.content
+            image = QImage()
+            if not image.loadFromData(data):
+                raise ValueError(f"Could not decode cover: {url}")
+            scaled = image.scaled(50, 70, Qt.AspectRatioMode.KeepAspectRatio,
+                                  Qt.TransformationMode.SmoothTransformation)
+            if not self._destroyed:
+                self.thumb_ready.emit(url, scaled)
+        except Exception:
+            if not self._destroyed:
+                self.thumb_failed.emit()
+
+    def _on_thumb_ready(self, url, image):
+        # GUI thread: convert the decoded image to a pixmap and cache
+        # it for the next widget showing the same cover
+        pixmap = QPixmap.fromImage(image)
+        self._thumb_cache[url] = pixmap
+        self.thumb.setPixmap(pixmap)
 
 class QueueManagerDialog(QDialog):
     def __init__(self, parent=None):
@@ -100,23 +168,18 @@ class QueueManagerDialog(QDialog):
         
         self.queue_container = QWidget()
         self.queue_layout = QVBoxLayout(self.queue_container)
+        # Trailing stretch added once; rows are inserted ahead of it
+        self.queue_layout.addStretch()
         scroll.setWidget(self.queue_container)
         layout.addWidget(scroll)
+
+        # Live row widgets keyed by task content, diffed against the
+        # queue each tick instead of rebuilt from scratch
+        self._item_widgets = {}
         
         # Overall progress
         self.overall_progress = QProgressBar()
-        self.overall_progress.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background-color: #424242;
-                border-radius: 3px;
-                height: 8px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
+        self.overall_progress.setStyleSheet(OVERALL_PROGRESS_QSS)
         layout.addWidget(self.overall_progress)
         
         self.progress_label = QLabel("No active translations")
@@ -133,27 +196,38 @@ class QueueManagerDialog(QDialog):
         self.update_queue_status()
     
     def update_queue_status(self):
-        # Clear existing items
-        while self.queue_layout.count():
-            child = self.queue_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
         # Get current status
         status = self.translator.queue_status
-        
-        # Add current task if exists
+
+        # Desired rows, in display order, with their progress values
+        tasks = []
         if status.current_task:
-            item = QueueItemWidget(status.current_task)
-            item.progress.setValue(int(status.current_progress))
-            self.queue_layout.addWidget(item)
-        
-        # Add queued tasks
+            tasks.append((status.current_task, int(status.current_progress)))
         for task in status.queued_chapters:
-            item = QueueItemWidget(task)
-            item.progress.setValue(0)
-            self.queue_layout.addWidget(item)
-        
+            tasks.append((task, 0))
+
+        # Diff against the live widgets: create rows only for new
+        # tasks, update progress on survivors, drop finished ones —
+        # no per-tick widget churn or thumbnail refetch. Keys are task
+        # content, not id(): the service replaces task objects between
+        # ticks and CPython can hand a new task a freed one's address
+        wanted = set()
+        for position, (task, progress) in enumerate(tasks):
+            key = (type(task).__name__,
+                   task.chapter.manga_title, task.chapter.number)
+            wanted.add(key)
+            item = self._item_widgets.get(key)
+            if item is None:
+                item = QueueItemWidget(task)
+                self._item_widgets[key] = item
+                self.queue_layout.insertWidget(position, item)
+            item.progress.setValue(progress)
+
+        for key in [k for k in self._item_widgets if k not in wanted]:
+            item = self._item_widgets.pop(key)
+            self.queue_layout.removeWidget(item)
+            item.deleteLater()
+
         # Update overall progress
         total = status.tasks_remaining + 1 if status.current_task else status.tasks_remaining
         completed = len(self.translator.completed_translations)
@@ -164,10 +238,7 @@ class QueueManagerDialog(QDialog):
         else:
             self.overall_progress.setValue(0)
             self.progress_label.setText("No active translations")
-        
-        # Add stretch to push items to top
-        self.queue_layout.addStretch()
-    
+
     def closeEvent(self, event):
         self.update_timer.stop()
         super().closeEvent(event) 
\ No newline at end of file
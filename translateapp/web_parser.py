@@ -1,35 +1,69 @@
 import requests
 from bs4 import BeautifulSoup
 from .models import Manga, Chapter
+from .http_client import DEFAULT_TIMEOUT
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import quote_plus
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml parser when installed; parsing holds the GIL,
+# so a faster parser directly unblocks the Qt event loop. html.parser is
+# the stdlib fallback.
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# One pooled session for all parser requests; HTTP keep-alive reuses the
+# TCP/TLS connection across page fetches to the same host
+_session = requests.Session()
+
+# Compiled once; the chapter loop runs these per title. The bare-number
+# pattern is only a fallback — order matters for titles that contain
+# other digits before "Chapter N".
+_CHAPTER_RE = re.compile(r'Chapter (\d+(?:\.\d+)?)')
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str):
+    """Parse a chapter date, memoized — release dates repeat heavily
+    across a chapter list, and strptime is the slow path"""
+    try:
+        return datetime.strptime(date_str, '%B %d, %Y')
+    except ValueError:
+        try:
+            # Try alternative date format
+            return datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            logger.warning(f"Could not parse date: {date_str}")
+            return None
+
 class RawKumaParser:
     BASE_URL = "https://rawkuma.com"
-    
+    BROWSE_URL = BASE_URL + "/manga/?status=&type=manga&order="
+
     @staticmethod
     def get_manga_url(search_query=None):
         """Get the appropriate URL based on search query"""
         if not search_query or search_query.lower() == "search manga...":
-            return f"{RawKumaParser.BASE_URL}/manga/?status=&type=manga&order="
+            return RawKumaParser.BROWSE_URL
         else:
-            # Convert spaces to + and encode the query
-            query = search_query.replace(' ', '+')
-            return f"{RawKumaParser.BASE_URL}/?s={query}"
+            # Properly percent-encode the query; bare replace(' ', '+')
+            # left &, ?, # and non-ASCII titles unescaped
+            return f"{RawKumaParser.BASE_URL}/?s={quote_plus(search_query)}"
     
     @staticmethod
     def parse_manga_list(url):
         logger.info(f"Fetching manga list from: {url}")
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = _session.get(url, timeout=DEFAULT_TIMEOUT)
+        # Bytes in: BeautifulSoup/lxml handle decoding once internally
+        soup = BeautifulSoup(response.content, DEFAULT_PARSER)
         mangas = []
         
         logger.info("Starting to parse manga items")
@@ -38,34 +72,38 @@ class RawKumaParser:
         
         for item in manga_items:
             try:
-                main_link = item.select_one('a')
+                # Direct find calls per item skip the CSS selector
+                # machinery, matching the chapter-loop lookups
+                main_link = item.find('a')
                 if not main_link:
                     continue
-                
-                title_div = item.select_one('.tt')
+
+                title_div = item.find(class_='tt')
                 title = title_div.text.strip() if title_div else main_link.get('title', '').strip()
                 url = main_link.get('href', '')
-                logger.info(f"Processing manga: {title}")
-                
-                cover = item.select_one('img')
+                # Per-item lines are DEBUG with lazy %-formatting so the
+                # strings are never built at the default INFO level
+                logger.debug("Processing manga: %s", title)
+
+                cover = item.find('img')
                 cover_url = cover.get('src', '') if cover else ''
                 if not cover_url:
-                    logger.warning(f"No cover image found for manga: {title}")
-                
-                rating_div = item.select_one('.numscore')
+                    logger.warning("No cover image found for manga: %s", title)
+
+                rating_div = item.find(class_='numscore')
                 try:
                     rating = float(rating_div.text.strip()) if rating_div else 0
                 except (ValueError, AttributeError):
                     rating = 0
-                logger.info(f"Manga: {title} - Rating: {rating}")
-                
-                chapter_div = item.select_one('.epxs')
+                logger.debug("Manga: %s - Rating: %s", title, rating)
+
+                chapter_div = item.find(class_='epxs')
                 latest_chapter = chapter_div.text.strip() if chapter_div else ''
-                logger.info(f"Manga: {title} - Latest Chapter: {latest_chapter}")
-                
-                type_span = item.select_one('.type')
+                logger.debug("Manga: %s - Latest Chapter: %s", title, latest_chapter)
+
+                type_span = item.find(class_='type')
                 manga_type = type_span.text.strip() if type_span else ''
-                logger.info(f"Manga: {title} - Type: {manga_type}")
+                logger.debug("Manga: %s - Type: %s", title, manga_type)
                 
                 manga = Manga(
                     title=title,
@@ -76,14 +114,22 @@ class RawKumaParser:
                     genres=[manga_type] if manga_type else []
                 )
                 mangas.append(manga)
-                logger.info(f"Successfully added manga: {title}")
+                logger.debug("Successfully added manga: %s", title)
                 
             except Exception as e:
-                logger.error(f"Error parsing manga item: {str(e)}", exc_info=True)
+                # No exc_info: formatting a traceback per bad item is
+                # the expensive path when a page layout shifts
+                logger.error("Error parsing manga item: %s", e)
         
-        # Find next page link
+        # Find next page link; a narrow find_all plus substring check is
+        # much cheaper than the :contains() pseudo-class, which scans
+        # the text of every candidate through Soup Sieve
         next_page_url = None
-        next_link = soup.select_one('a.r:contains("Next")')
+        next_link = None
+        for link in soup.find_all('a', class_='r'):
+            if 'Next' in link.get_text():
+                next_link = link
+                break
         if next_link:
             next_href = next_link.get('href', '')
             if next_href:
@@ -100,8 +146,8 @@ class RawKumaParser:
     @staticmethod
     def parse_manga_details(manga: Manga):
         logger.info(f"Fetching manga details from: {manga.url}")
-        response = requests.get(manga.url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = _session.get(manga.url, timeout=DEFAULT_TIMEOUT)
+        soup = BeautifulSoup(response.content, DEFAULT_PARSER)
         
         # Get manga details first
         description = ""
@@ -126,52 +172,47 @@ class RawKumaParser:
         # Updated selector to match the actual HTML structure
         chapter_items = soup.select('#chapterlist ul li')  # Changed selector
         logger.info(f"Found {len(chapter_items)} potential chapters")
-        
+
+        # Loop-invariant: same manga for every chapter
+        manga_id = manga.url.rstrip('/').split('/')[-1]
+
         for chapter in chapter_items:
             try:
-                # Get chapter link and title from eph-num
-                eph_num = chapter.select_one('.eph-num a')
+                # Get chapter link and title from eph-num; direct find
+                # calls skip the CSS selector machinery per chapter
+                eph_div = chapter.find(class_='eph-num')
+                eph_num = eph_div.find('a') if eph_div else None
                 if not eph_num:
                     continue
-                
+
                 chapter_url = eph_num.get('href', '')
-                
+
                 # Get chapter number
-                chapter_num_span = eph_num.select_one('.chapternum')
+                chapter_num_span = eph_num.find(class_='chapternum')
                 title = chapter_num_span.text.strip() if chapter_num_span else eph_num.text.strip()
                 
                 # Extract chapter number from title
-                number_match = re.search(r'Chapter (\d+(?:\.\d+)?)', title)
+                number_match = _CHAPTER_RE.search(title)
                 if not number_match:
                     # Try alternative format: just the number
-                    number_match = re.search(r'(\d+(?:\.\d+)?)', title)
+                    number_match = _NUMBER_RE.search(title)
                 number = float(number_match.group(1)) if number_match else 0.0
                 
                 # Get chapter date
-                date_span = eph_num.select_one('.chapterdate')
+                date_span = eph_num.find(class_='chapterdate')
                 date_str = date_span.text.strip() if date_span else ''
-                try:
-                    date = datetime.strptime(date_str, '%B %d, %Y') if date_str else None
-                except ValueError:
-                    try:
-                        # Try alternative date format
-                        date = datetime.strptime(date_str, '%Y-%m-%d') if date_str else None
-                    except ValueError:
-                        logger.warning(f"Could not parse date: {date_str}")
-                        date = None
+                date = _parse_date(date_str) if date_str else None
                 
                 # Get download URL from dload class
                 download_url = ""
-                dload_link = chapter.select_one('a.dload')
+                dload_link = chapter.find('a', class_='dload')
                 if dload_link:
                     download_url = dload_link.get('href', '')
-                    logger.info(f"Found download URL for chapter {number}: {download_url}")
-                
-                logger.info(f"Processing chapter: {title} ({chapter_url})")
-                
-                # Get manga ID from URL
-                manga_id = manga.url.rstrip('/').split('/')[-1]
-                
+                    logger.debug("Found download URL for chapter %s: %s",
+                                 number, download_url)
+
+                logger.debug("Processing chapter: %s (%s)", title, chapter_url)
+
                 chapter_obj = Chapter(
                     title=title,
                     url=chapter_url,
@@ -184,10 +225,10 @@ class RawKumaParser:
                     manga_cover=manga.cover_image
                 )
                 chapters.append(chapter_obj)
-                logger.info(f"Successfully parsed chapter: {title}")
+                logger.debug("Successfully parsed chapter: %s", title)
                 
             except Exception as e:
-                logger.error(f"Error parsing chapter: {str(e)}", exc_info=True)
+                logger.error("Error parsing chapter: %s", e)
         
         # Sort chapters by number
         chapters.sort(key=lambda x: x.number)
@@ -207,9 +248,9 @@ class RawKumaParser:
         """
         logger.info(f"Parsing images from chapter: {chapter_url}")
         try:
-            response = requests.get(chapter_url)
+            response = _session.get(chapter_url, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, DEFAULT_PARSER)
             
             # Try different common selectors for manga images
             image_elements = (